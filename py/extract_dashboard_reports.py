@@ -3,8 +3,14 @@ import os
 import sys
 import logging
 import argparse
+import multiprocessing
 import xml.etree.ElementTree as ET
-from typing import Dict, List, Tuple
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Iterable, List, Tuple
 import re
 from urllib.parse import unquote
 
@@ -21,6 +27,18 @@ console_handler.setLevel(logging.INFO)
 logger.addHandler(file_handler)
 logger.addHandler(console_handler)
 
+# Buffer size for CSV reads/writes; larger than io.DEFAULT_BUFFER_SIZE to cut syscalls
+_IO_BUFFER_SIZE = 1 << 20
+
+# Repository root (parent of this script's folder); default input/output locations hang off it
+_REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Catalog root used to turn page/report file paths into /shared/... catalog paths
+_INPUT_XML_ROOT = os.path.join(_REPO_ROOT, 'input_xml')
+
+# Default destination for the generated CSVs
+_OUTPUT_CSV_DIR = os.path.join(_REPO_ROOT, 'data', 'tmp', 'output_csv')
+
 def read_csv_as_dict(csv_path: str) -> List[Dict]:
     """
     Read CSV file and return as list of dictionaries.
@@ -29,7 +47,7 @@ def read_csv_as_dict(csv_path: str) -> List[Dict]:
         logger.warning(f"CSV file not found: {csv_path}")
         return []
     try:
-        with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+        with open(csv_path, 'r', encoding='utf-8', newline='', buffering=_IO_BUFFER_SIZE) as f:
             reader = csv.DictReader(f)
             rows = list(reader)
             logger.info(f"Read {len(rows)} rows from {csv_path}")
@@ -38,101 +56,113 @@ def read_csv_as_dict(csv_path: str) -> List[Dict]:
         logger.error(f"Failed to read CSV file {csv_path}: {e}")
         return []
 
-def write_csv(path: str, fieldnames: List[str], rows: List[Dict]) -> None:
+def write_csv(path: str, fieldnames: List[str], rows: Iterable) -> int:
     """
     Write CSV file with given fieldnames and rows.
+    Rows are either dicts keyed by fieldname or tuples already in fieldnames order; any iterable,
+    including a generator, is streamed to the file. Returns the number of rows written.
     """
+    row_count = 0
+
+    def as_tuples():
+        # Emit rows as tuples in header order; missing keys become '' and extra keys are ignored
+        nonlocal row_count
+        for row in rows:
+            row_count += 1
+            yield row if isinstance(row, tuple) else tuple(row.get(k, '') for k in fieldnames)
+
+    # Rows are written to a temporary file that replaces path only once every row is out, so a failed
+    # write or an error raised by a row generator (which propagates to the caller) never leaves a partial CSV
+    tmp_path = path + '.tmp'
     try:
         os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
-            writer.writeheader()
-            writer.writerows(rows)
-        logger.info(f"Wrote {len(rows)} rows to {path}")
-    except Exception as e:
+        with open(tmp_path, 'w', newline='', encoding='utf-8', buffering=_IO_BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            writer.writerows(as_tuples())
+        os.replace(tmp_path, path)
+        logger.info(f"Wrote {row_count} rows to {path}")
+    except OSError as e:
         logger.error(f"Failed to write CSV file {path}: {e}")
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return row_count
+
+_BY_CLAUSE = r"saw_1\s*,\s*saw_2\s*,\s*saw_3\s*,\s*saw_0\s*,\s*saw_10\s*,\s*saw_11\s*,\s*saw_12"
+_TABLENAME_SUM_RE = re.compile(
+    rf"^\s*SUM\s*\(saw_\d+\s+by\s+{_BY_CLAUSE}\)\s*-\s*SUM\s*\(saw_\d+\s+by\s+{_BY_CLAUSE}\)\s*$",
+    re.IGNORECASE,
+)
+# Match variations in whitespace and quoting around the variable name
+_BISERVER_VAR_RE = re.compile(r"^\s*@\{\s*biServer\.variables\[(['\"])Rvar_Curr_MonthName\1\]\s*\}\s*$",
+                              re.IGNORECASE)
+
+def _is_erroneous_tablenames(value) -> bool:
+    """
+    True when a TableNames value is blank or holds the SUM(...) - SUM(...) expression.
+    """
+    tval = str(value or '').strip()
+    if not tval:
+        return True
+    # Only values starting with SUM and containing the '-' between the two sums can match,
+    # so skip the regex engine otherwise.
+    return tval[:3].upper() == 'SUM' and '-' in tval and _TABLENAME_SUM_RE.match(tval) is not None
 
-def _filter_erroneous_tablenames_rows(rows: List[Dict]) -> Tuple[List[Dict], int]:
+def _iter_cleaned_worksheet_rows(rows, counts: Dict[str, int]):
     """
-    Remove rows where the 'TableNames' field is invalid for Worksheets.csv output.
+    Apply the Worksheets.csv clean-up rules to a stream of worksheet rows.
 
-    Current invalid cases handled:
+    Rows are dropped when 'TableNames' is invalid:
     1) TableNames is empty/blank.
     2) TableNames erroneously contains a SUM(...) - SUM(...) expression of the form:
          SUM (saw_<n> by saw_1, saw_2, saw_3, saw_0, saw_10, saw_11, saw_12)
          - SUM (saw_<m> by saw_1, saw_2, saw_3, saw_0, saw_10, saw_11, saw_12)
 
-    Returns (filtered_rows, removed_count).
-    """
-    by_clause = r"saw_1\s*,\s*saw_2\s*,\s*saw_3\s*,\s*saw_0\s*,\s*saw_10\s*,\s*saw_11\s*,\s*saw_12"
-    pattern = re.compile(
-        rf"^\s*SUM\s*\(saw_\d+\s+by\s+{by_clause}\)\s*-\s*SUM\s*\(saw_\d+\s+by\s+{by_clause}\)\s*$",
-        re.IGNORECASE,
-    )
-
-    kept: List[Dict] = []
-    removed = 0
-    for r in rows:
-        tval = str(r.get('TableNames', '') or '').strip()
-        # Case 1: Empty/blank TableNames
-        if not tval:
-            removed += 1
-            continue
-        # Case 2: Erroneous SUM(...)-SUM(...) expression mistakenly in TableNames
-        if pattern.match(tval):
-            removed += 1
-            continue
-        kept.append(r)
-    return kept, removed
-
-def _normalize_columnnames_biserver_variables(rows: List[Dict]) -> Tuple[List[Dict], int]:
-    """
-    Normalize ColumnNames that are populated with OBIEE variable syntax for current month name.
-
-    If ColumnNames equals the expression:
+    ColumnNames equal to the OBIEE variable expression
         @{
           biServer.variables['Rvar_Curr_MonthName']
         }
-    then replace it with just:
+    are replaced with just:
         Rvar_Curr_MonthName
 
-    Returns (updated_rows, replacement_count).
+    Yields the kept rows and tallies counts['removed'] and counts['replaced'] as rows pass through.
     """
-    # Match variations in whitespace and quoting around the variable name
-    pattern = re.compile(r"^\s*@\{\s*biServer\.variables\[(['\"])Rvar_Curr_MonthName\1\]\s*\}\s*$",
-                         re.IGNORECASE)
-    replaced = 0
     for r in rows:
+        if _is_erroneous_tablenames(r.get('TableNames', '')):
+            counts['removed'] += 1
+            continue
         col = str(r.get('ColumnNames', '') or '')
-        if pattern.match(col):
+        # The variable syntax always contains '@'; skip the regex for plain names
+        if '@' in col and _BISERVER_VAR_RE.match(col):
             r['ColumnNames'] = 'Rvar_Curr_MonthName'
-            replaced += 1
-    return rows, replaced
+            counts['replaced'] += 1
+        yield r
+
+# Fixed ChartType value per non-chart view type; dvtchart views use the chart's display type
+_CHART_TYPE_BY_VIEW = {
+    'tableView': 'table',
+    'pivotTableView': 'pivot',
+    'compoundView': 'compound',
+    'titleView': 'title',
+}
 
 def create_chart_type_data(reports_data: List[Dict], charts_data: List[Dict], views_data: List[Dict]) -> List[Dict]:
     """
     Create ChartType data from XML extraction.
     """
     chart_type_rows = []
-    chart_type_map = {}
-    for chart in charts_data:
-        chart_type_map[chart.get('view_name', '')] = chart.get('display_type', '')
+    chart_type_map = {chart.get('view_name', ''): chart.get('display_type', '') for chart in charts_data}
     logger.info("Created chart type map for quick lookup")
+    chart_type_get = chart_type_map.get
+    view_chart_type_get = _CHART_TYPE_BY_VIEW.get
     for view in views_data:
         view_name = view.get('view_name', '')
         view_type = view.get('view_xsi_type', '')
         if view_type == 'dvtchart':
-            chart_type = chart_type_map.get(view_name, 'unknown')
-        elif view_type == 'tableView':
-            chart_type = 'table'
-        elif view_type == 'pivotTableView':
-            chart_type = 'pivot'
-        elif view_type == 'compoundView':
-            chart_type = 'compound'
-        elif view_type == 'titleView':
-            chart_type = 'title'
+            chart_type = chart_type_get(view_name, 'unknown')
         else:
-            chart_type = view_type
+            chart_type = view_chart_type_get(view_type, view_type)
         chart_type_rows.append({
             'WorkbookName': view.get('report_file', ''),
             'WorksheetName': view.get('report_file', ''),
@@ -148,12 +178,14 @@ def create_filters_data(reports_data: List[Dict], columns_data: List[Dict],
     Create Filters data from XML extraction.
     """
     filter_rows = []
+    # Workbook/worksheet names repeat across many rows; share one string object per value
+    intern = sys.intern
     column_map = {}
     for col in columns_data:
         column_map[col.get('column_id', '')] = col
     # Build column map for filters creation
     for order in column_orders_data:
-        report_name = order.get('report_file', '')
+        report_name = intern(order.get('report_file', ''))
         col_id = order.get('column_id', '')
         direction = order.get('direction', '')
         col_info = column_map.get(col_id, {})
@@ -178,8 +210,8 @@ def create_filters_data(reports_data: List[Dict], columns_data: List[Dict],
     logger.info(f"Added {len(column_orders_data)} sort filter rows")
 
     for category in chart_categories_data:
-        report_name = category.get('report_file', '')
-        view_name = category.get('view_name', '')
+        report_name = intern(category.get('report_file', ''))
+        view_name = intern(category.get('view_name', ''))
         col_id = category.get('column_id', '')
         col_info = column_map.get(col_id, {})
         expression = col_info.get('expression', '')
@@ -202,21 +234,28 @@ def create_filters_data(reports_data: List[Dict], columns_data: List[Dict],
         })
     logger.info(f"Added {len(chart_categories_data)} category filter rows")
 
+    # (Function, ui-pattern_text) per (measure_type, riser_type); the pairs repeat across charts
+    measure_labels = {}
+
     for measure in chart_measures_data:
-        report_name = measure.get('report_file', '')
-        view_name = measure.get('view_name', '')
+        report_name = intern(measure.get('report_file', ''))
+        view_name = intern(measure.get('view_name', ''))
         col_id = measure.get('column_id', '')
         measure_type = measure.get('measure_type', '')
         riser_type = measure.get('riser_type', '')
         col_info = column_map.get(col_id, {})
         expression = col_info.get('expression', '')
+        labels = measure_labels.get((measure_type, riser_type))
+        if labels is None:
+            labels = measure_labels[(measure_type, riser_type)] = (
+                f'{measure_type} {riser_type}', f'Chart measure ({riser_type})')
         filter_rows.append({
             'WorkbookName': report_name,
             'SharedViewName': '',
             'WorksheetName': view_name,
             'Class': 'Include',
             'Column': expression,
-            'Function': f'{measure_type} {riser_type}',
+            'Function': labels[0],
             'ui-enumeration': '',
             'InstanceName': '',
             'ObjectName': col_id,
@@ -224,63 +263,47 @@ def create_filters_data(reports_data: List[Dict], columns_data: List[Dict],
             'ui-domain': '',
             'ui-marker': '',
             'expression': expression,
-            'ui-pattern_text': f'Chart measure ({riser_type})',
+            'ui-pattern_text': labels[1],
             'ui-pattern_type': 'include',
         })
     logger.info(f"Added {len(chart_measures_data)} measure filter rows")
     logger.info(f"Total filter rows: {len(filter_rows)}")
     return filter_rows
 
+# view type -> (WindowClass, ZoomType, y_p) for the Windows rows
+_VIEW_META = {
+    'dvtchart': ('Chart', 'entire-view', '100'),
+    'tableView': ('Table', 'fit-width', '200'),
+    'pivotTableView': ('Pivot', 'fit-width', '200'),
+    'compoundView': ('Compound', 'entire-view', '0'),
+    'titleView': ('Title', 'entire-view', '0'),
+}
+_DEFAULT_VIEW_META = ('View', 'entire-view', '0')
+
 def create_windows_data(reports_data: List[Dict], views_data: List[Dict], charts_data: List[Dict]) -> List[Dict]:
     """
     Create Windows data from XML extraction.
     """
     window_rows = []
-    chart_map = {}
-    for chart in charts_data:
-        chart_map[chart.get('view_name', '')] = chart
+    intern = sys.intern
+    chart_map = {chart.get('view_name', ''): chart for chart in charts_data}
     logger.info("Built chart map for window creation")
+    chart_get = chart_map.get
+    view_meta_get = _VIEW_META.get
     for view in views_data:
-        report_name = view.get('report_file', '')
-        view_name = view.get('view_name', '')
+        report_name = intern(view.get('report_file', ''))
+        view_name = intern(view.get('view_name', ''))
         view_type = view.get('view_xsi_type', '')
-        if view_type == 'dvtchart':
-            window_class = 'Chart'
-            zoom_type = 'entire-view'
-            maximized = 'False'
-        elif view_type == 'tableView':
-            window_class = 'Table'
-            zoom_type = 'fit-width'
-            maximized = 'False'
-        elif view_type == 'pivotTableView':
-            window_class = 'Pivot'
-            zoom_type = 'fit-width'
-            maximized = 'False'
-        elif view_type == 'compoundView':
-            window_class = 'Compound'
-            zoom_type = 'entire-view'
-            maximized = 'False'
-        elif view_type == 'titleView':
-            window_class = 'Title'
-            zoom_type = 'entire-view'
-            maximized = 'False'
+        window_class, zoom_type, y_pos = view_meta_get(view_type, _DEFAULT_VIEW_META)
+        maximized = 'False'
+        if window_class == 'Chart':
+            chart_info = chart_get(view_name, {})
+            height = chart_info.get('canvas_height', '400')
+            width = chart_info.get('canvas_width', '800')
         else:
-            window_class = 'View'
-            zoom_type = 'entire-view'
-            maximized = 'False'
-        chart_info = chart_map.get(view_name, {})
-        height = chart_info.get('canvas_height', '400') if window_class == 'Chart' else '400'
-        width = chart_info.get('canvas_width', '800') if window_class == 'Chart' else '800'
+            height = '400'
+            width = '800'
         x_pos = '0'
-        y_pos = '0'
-        if view_type == 'titleView':
-            y_pos = '0'
-        elif view_type == 'dvtchart':
-            y_pos = '100'
-        elif view_type == 'tableView':
-            y_pos = '200'
-        elif view_type == 'pivotTableView':
-            y_pos = '200'
         window_rows.append({
             'WorkbookName': report_name,
             'WindowName': view_name,
@@ -307,52 +330,77 @@ def create_worksheets_data(reports_data: List[Dict], columns_data: List[Dict], v
     Create Worksheets data from XML extraction.
     """
     worksheet_rows = []
+    intern = sys.intern
     column_map = {}
     for col in columns_data:
         column_map[col.get('column_id', '')] = col
+    # Bucket every per-view input once so each (report, view) lookup is a dict hit
+    views_by_report = defaultdict(list)
+    for v in views_data:
+        views_by_report[v.get('report_file')].append(v)
+    edges_by_key = defaultdict(list)
+    for e in edge_layers_data:
+        edges_by_key[(e.get('report_file'), e.get('view_name'))].append(e)
+    chart_measures_by_key = defaultdict(list)
+    for cm in chart_measures_data:
+        chart_measures_by_key[(cm.get('report_file'), cm.get('view_name'))].append(cm)
+    chart_categories_by_key = defaultdict(list)
+    for cc in chart_categories_data:
+        chart_categories_by_key[(cc.get('report_file'), cc.get('view_name'))].append(cc)
+    pivot_measures_by_key = defaultdict(list)
+    for pm in pivot_measures_data:
+        pivot_measures_by_key[(pm.get('report_file'), pm.get('view_name'))].append(pm)
+    # (table_name, source_column) per column id, split from its expression once
+    expr_parts = {}
+    # '[col_id]' per column id, shared by every view that uses the column
+    instance_names = {}
     # Create column map for worksheets
     for report in reports_data:
-        report_name = report.get('report_file', '')
-        report_views = [v for v in views_data if v.get('report_file') == report_name]
+        report_name = intern(report.get('report_file', ''))
+        data_source = report.get('subject_area', '').strip('"')
+        report_views = views_by_report.get(report_name, ())
         for view in report_views:
-            view_name = view.get('view_name', '')
+            view_name = intern(view.get('view_name', ''))
             view_type = view.get('view_xsi_type', '')
-            view_edges = [e for e in edge_layers_data if e.get('report_file') == report_name and e.get('view_name') == view_name]
-            view_chart_measures = [cm for cm in chart_measures_data if cm.get('report_file') == report_name and cm.get('view_name') == view_name]
-            view_chart_categories = [cc for cc in chart_categories_data if cc.get('report_file') == report_name and cc.get('view_name') == view_name]
-            view_pivot_measures = [pm for pm in pivot_measures_data if pm.get('report_file') == report_name and pm.get('view_name') == view_name]
-            all_columns = set()
-            for edge in view_edges:
-                col_id = edge.get('column_id', '')
-                if col_id and col_id in column_map:
-                    all_columns.add(col_id)
-            for measure in view_chart_measures:
-                col_id = measure.get('column_id', '')
-                if col_id and col_id in column_map:
-                    all_columns.add(col_id)
-            for category in view_chart_categories:
-                col_id = category.get('column_id', '')
-                if col_id and col_id in column_map:
-                    all_columns.add(col_id)
-            for pivot_measure in view_pivot_measures:
-                col_id = pivot_measure.get('column_id', '')
-                if col_id and col_id in column_map:
-                    all_columns.add(col_id)
+            key = (report_name, view_name)
+            view_edges = edges_by_key.get(key, ())
+            view_chart_measures = chart_measures_by_key.get(key, ())
+            view_chart_categories = chart_categories_by_key.get(key, ())
+            view_pivot_measures = pivot_measures_by_key.get(key, ())
+            measure_ids = {cm.get('column_id', '') for cm in view_chart_measures}
+            pivot_ids = {pm.get('column_id', '') for pm in view_pivot_measures}
+            all_columns = {
+                col_id
+                for col_id in chain(
+                    (edge.get('column_id', '') for edge in view_edges),
+                    (category.get('column_id', '') for category in view_chart_categories),
+                    measure_ids,
+                    pivot_ids,
+                )
+                if col_id and col_id in column_map
+            }
             for col_id in all_columns:
                 col_info = column_map.get(col_id, {})
                 expression = col_info.get('expression', '')
                 object_type = 'Column'
-                if col_id in [cm.get('column_id', '') for cm in view_chart_measures]:
+                if col_id in measure_ids:
                     object_type = 'Measure'
-                elif col_id in [pm.get('column_id', '') for pm in view_pivot_measures]:
+                elif col_id in pivot_ids:
                     object_type = 'Measure'
-                table_name = ''
-                source_column = ''
-                if expression and '.' in expression:
-                    parts = expression.split('.')
-                    if len(parts) >= 2:
-                        table_name = parts[0].strip('"')
-                        source_column = parts[1].strip('"')
+                parts = expr_parts.get(col_id)
+                if parts is None:
+                    table_name = ''
+                    source_column = ''
+                    if expression and '.' in expression:
+                        # First two dot-separated segments: "Table"."Column"[...]
+                        head, _, rest = expression.partition('.')
+                        table_name = intern(head.strip('"'))
+                        source_column = intern(rest.partition('.')[0].strip('"'))
+                    parts = expr_parts[col_id] = (table_name, source_column)
+                table_name, source_column = parts
+                instance_name = instance_names.get(col_id)
+                if instance_name is None:
+                    instance_name = instance_names[col_id] = f'[{col_id}]'
                 data_type = 'string'
                 if 'Amount' in source_column or 'Quantity' in source_column:
                     data_type = 'number'
@@ -364,7 +412,7 @@ def create_worksheets_data(reports_data: List[Dict], columns_data: List[Dict], v
                 worksheet_rows.append({
                     'WorkbookName': report_name,
                     'WorksheetName': view_name,
-                    'DataSourceName': report.get('subject_area', '').strip('"'),
+                    'DataSourceName': data_source,
                     'ObjectName_x': col_id,
                     'SourceColumn': source_column,
                     'ObjectType': object_type,
@@ -372,11 +420,11 @@ def create_worksheets_data(reports_data: List[Dict], columns_data: List[Dict], v
                     'Formula': expression,
                     'Format': '',
                     'SummarizeBy': '',
-                    'InstanceName': f'[{col_id}]',
+                    'InstanceName': instance_name,
                     'Derivation': derivation,
                     'Pivot': 'True' if 'pivot' in view_type else 'False',
                     'Type': 'nominal' if object_type == 'Column' else 'quantitative',
-                    'DataSource': report.get('subject_area', '').strip('"'),
+                    'DataSource': data_source,
                     'TableName': table_name,
                     'LocalName': source_column,
                     'DisplayName': source_column,
@@ -431,6 +479,11 @@ NAMESPACES: Dict[str, str] = {
     'sawd': 'com.siebel.analytics.web/dashboard/v1.1',
 }
 
+# Clark-notation name of the xsi:type attribute, built once
+_XSI_TYPE = '{%s}type' % NAMESPACES['xsi']
+# Clark-notation tag of filter expression nodes
+_SAWX_EXPR = '{%s}expr' % NAMESPACES['sawx']
+
 def ensure_dir(path: str) -> None:
     """
     Ensure a directory exists; create it if missing.
@@ -456,7 +509,8 @@ def text(elem: ET.Element) -> str:
     all_text = ''.join(elem.itertext())
     # Normalize whitespace: replace multiple spaces/newlines with single space
     value = ' '.join(all_text.split())
-    logger.debug(f"text() -> '{value[:100]}'" + ("..." if len(value) > 100 else ""))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("text() -> '%s'%s", value[:100], "..." if len(value) > 100 else "")
     return value
 
 def get_attr(elem: ET.Element, name: str, default: str = '') -> str:
@@ -464,51 +518,83 @@ def get_attr(elem: ET.Element, name: str, default: str = '') -> str:
     Get attribute from element with default for None or missing.
     """
     if elem is None:
-        logger.debug(f"get_attr(None, {name}) -> default '{default}'")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("get_attr(None, %s) -> default '%s'", name, default)
         return default
     value = str(elem.attrib.get(name, default))
-    logger.debug(f"get_attr(..., {name}) -> '{value}'")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("get_attr(..., %s) -> '%s'", name, value)
     return value
 
+_PATH_QUOTED_RE = re.compile(r"""("[^"]*"|'[^']*')""")
+_PATH_PREFIX_RE = re.compile(r"(?<![\w.{-])([A-Za-z_][\w.-]*):(?=[A-Za-z_*])")
+
+@lru_cache(maxsize=None)
+def _qualify_path(path: str) -> str:
+    """
+    Expand 'prefix:name' steps of an ElementPath expression to Clark notation
+    ('{uri}name') using NAMESPACES, leaving quoted literals untouched.
+    ElementTree keys its compiled-path cache on the sorted namespace map when one
+    is passed, so pre-qualified paths hit that cache without the per-call sort.
+    """
+    def _expand(match):
+        uri = NAMESPACES.get(match.group(1))
+        return '{%s}' % uri if uri is not None else match.group(0)
+    parts = _PATH_QUOTED_RE.split(path)
+    # Odd indexes are the quoted literals captured by the split
+    for i in range(0, len(parts), 2):
+        parts[i] = _PATH_PREFIX_RE.sub(_expand, parts[i])
+    return ''.join(parts)
+
 def find(elem: ET.Element, path: str) -> ET.Element:
     """
     Namespaced find.
     """
-    found = elem.find(path, NAMESPACES) if elem is not None else None
-    logger.debug(f"find(path='{path}') -> {'found' if found is not None else 'None'}")
+    found = elem.find(_qualify_path(path)) if elem is not None else None
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("find(path='%s') -> %s", path, 'found' if found is not None else 'None')
     return found
 
 def findall(elem: ET.Element, path: str) -> List[ET.Element]:
     """
     Namespaced findall.
     """
-    results = elem.findall(path, NAMESPACES) if elem is not None else []
-    logger.debug(f"findall(path='{path}') -> {len(results)} elements")
+    results = elem.findall(_qualify_path(path)) if elem is not None else []
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("findall(path='%s') -> %d elements", path, len(results))
     return results
 
+@lru_cache(maxsize=1024)
 def strip_prefix(value: str, prefix: str) -> str:
     """
     Strip prefix from string if present.
+    Cached: the inputs are a small set of xsi:type values seen over and over.
     """
     if not value:
         logger.debug("strip_prefix: empty value")
         return value
     out = value[len(prefix):] if value.startswith(prefix) else value
-    logger.debug(f"strip_prefix('{prefix}') -> '{out}' from '{value}'")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("strip_prefix('%s') -> '%s' from '%s'", prefix, out, value)
     return out
 
 _VIEW_SUFFIX_RE = re.compile(r"!\d+$")
 
+@lru_cache(maxsize=1024)
 def normalize_view_name(name: str) -> str:
     """
     Normalize a view name by removing suffix like '!1'.
+    Cached: each view name is normalized several times per report.
     """
     if not name:
         logger.debug("normalize_view_name: empty name")
         return name
+    # Most view names carry no '!N' suffix; skip the regex for those
+    if '!' not in name:
+        return name
     normalized = _VIEW_SUFFIX_RE.sub('', name)
-    if normalized != name:
-        logger.debug(f"normalize_view_name: '{name}' -> '{normalized}'")
+    if normalized != name and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("normalize_view_name: '%s' -> '%s'", name, normalized)
     return normalized
 
 def parse_report(xml_path: str) -> Tuple[
@@ -540,8 +626,11 @@ def parse_report(xml_path: str) -> Tuple[
     chart_measure_rows: List[Dict] = []
     measures_list_rows: List[Dict] = []
 
+    # Ids, names and enum-like attributes repeat across rows and reports; share one str per value
+    intern = sys.intern
+
     # Normalize report file: strip .xml suffix
-    report_name = os.path.splitext(os.path.basename(xml_path))[0]
+    report_name = intern(os.path.splitext(os.path.basename(xml_path))[0])
     # Extract report base name
 
     # Report-level information
@@ -554,7 +643,7 @@ def parse_report(xml_path: str) -> Tuple[
         try:
             nested_sas = []
             for crit in findall(root, './/saw:criteria'):
-                xsi_t = strip_prefix(get_attr(crit, '{%s}type' % NAMESPACES['xsi']), 'saw:')
+                xsi_t = strip_prefix(get_attr(crit, _XSI_TYPE), 'saw:')
                 if xsi_t == 'simpleCriteria':
                     sa = get_attr(crit, 'subjectArea', '')
                     if sa:
@@ -570,7 +659,7 @@ def parse_report(xml_path: str) -> Tuple[
             pass
     within_hierarchy = get_attr(criteria, 'withinHierarchy') if criteria is not None else ''
     xml_version = get_attr(root, 'xmlVersion')
-    xsi_type = get_attr(criteria, '{%s}type' % NAMESPACES['xsi']) if criteria is not None else ''
+    xsi_type = get_attr(criteria, _XSI_TYPE) if criteria is not None else ''
     xsi_type = strip_prefix(xsi_type, 'saw:')
 
     report_rows.append({
@@ -584,10 +673,10 @@ def parse_report(xml_path: str) -> Tuple[
 
     # Columns in criteria
     for col in findall(root, 'saw:criteria/saw:columns/saw:column'):
-        col_id = get_attr(col, 'columnID')
-        col_type = strip_prefix(get_attr(col, '{%s}type' % NAMESPACES['xsi']), 'saw:')
+        col_id = intern(get_attr(col, 'columnID'))
+        col_type = strip_prefix(get_attr(col, _XSI_TYPE), 'saw:')
         expr_elem = find(col, 'saw:columnFormula/sawx:expr')
-        expr_type = strip_prefix(strip_prefix(get_attr(expr_elem, '{%s}type' % NAMESPACES['xsi']), 'saw:'), 'sawx:') if expr_elem is not None else ''
+        expr_type = strip_prefix(strip_prefix(get_attr(expr_elem, _XSI_TYPE), 'saw:'), 'sawx:') if expr_elem is not None else ''
         expr_text = text(expr_elem)
         
         # Extract table heading and column heading
@@ -612,8 +701,8 @@ def parse_report(xml_path: str) -> Tuple[
     for order_ref in findall(root, 'saw:criteria/saw:columnOrder/saw:columnOrderRef'):
         column_order_rows.append({
             'report_file': report_name,
-            'column_id': get_attr(order_ref, 'columnID'),
-            'direction': get_attr(order_ref, 'direction'),
+            'column_id': intern(get_attr(order_ref, 'columnID')),
+            'direction': intern(get_attr(order_ref, 'direction')),
         })
     logger.info(f"Column orders extracted: {len(column_order_rows)} for '{report_name}'")
 
@@ -626,7 +715,13 @@ def parse_report(xml_path: str) -> Tuple[
     compound_children_order = []  # normalized names
     compound_children_order_raw = []  # raw names with suffix like '!1'
     compound_view_children_raw_set = set()
-    for compound_view in findall(root, 'saw:views/saw:view[@xsi:type="saw:compoundView"]'):
+    # Walk the view list once and bucket elements by their raw xsi:type so the
+    # per-type passes below don't each re-run an XPath over the whole document
+    all_views = findall(root, 'saw:views/saw:view')
+    views_by_type = defaultdict(list)
+    for view in all_views:
+        views_by_type[get_attr(view, _XSI_TYPE)].append(view)
+    for compound_view in views_by_type['saw:compoundView']:
         # Extract view names from cvCell viewName attributes in order
         for cv_cell in findall(compound_view, './/saw:cvCell'):
             child_view_name_raw = get_attr(cv_cell, 'viewName')
@@ -636,10 +731,10 @@ def parse_report(xml_path: str) -> Tuple[
                 compound_children_order_raw.append(child_view_name_raw)
                 compound_view_children_raw_set.add(child_view_name_raw)
     
-    for view in findall(root, 'saw:views/saw:view'):
-        view_name_raw = get_attr(view, 'name')
-        view_name = normalize_view_name(view_name_raw)
-        view_type = strip_prefix(get_attr(view, '{%s}type' % NAMESPACES['xsi']), 'saw:')
+    for view in all_views:
+        view_name_raw = intern(get_attr(view, 'name'))
+        view_name = intern(normalize_view_name(view_name_raw))
+        view_type = strip_prefix(get_attr(view, _XSI_TYPE), 'saw:')
         view_rows.append({
             'report_file': report_name,
             'view_name': view_name,
@@ -654,12 +749,11 @@ def parse_report(xml_path: str) -> Tuple[
     logger.info(f"Views extracted: {len(view_rows)} for '{report_name}' (compound view children: {len(compound_children_order)})")
 
     # Table/pivot edges and layers
-    table_like_views = findall(root, 'saw:views/saw:view[@xsi:type="saw:tableView"]') + \
-                       findall(root, 'saw:views/saw:view[@xsi:type="saw:pivotTableView"]')
-    for table_like in table_like_views:
-        view_name = normalize_view_name(get_attr(table_like, 'name'))
+    # Table views first, then pivots, as both come out of the same bucketing pass
+    for table_like in chain(views_by_type['saw:tableView'], views_by_type['saw:pivotTableView']):
+        view_name = intern(normalize_view_name(get_attr(table_like, 'name')))
         for edge in findall(table_like, 'saw:edges/saw:edge'):
-            axis = get_attr(edge, 'axis')
+            axis = intern(get_attr(edge, 'axis'))
             show_header = get_attr(edge, 'showColumnHeader')
             edge_rows.append({
                 'report_file': report_name,
@@ -672,27 +766,27 @@ def parse_report(xml_path: str) -> Tuple[
                     'report_file': report_name,
                     'view_name': view_name,
                     'axis': axis,
-                    'layer_type': get_attr(layer, 'type'),
-                    'column_id': get_attr(layer, 'columnID'),
-                    'agg_rule': get_attr(layer, 'aggRule'),
+                    'layer_type': intern(get_attr(layer, 'type')),
+                    'column_id': intern(get_attr(layer, 'columnID')),
+                    'agg_rule': intern(get_attr(layer, 'aggRule')),
                 })
     logger.info(f"Edges extracted: {len(edge_rows)}; Edge layers: {len(edge_layer_rows)} for '{report_name}'")
 
     # Pivot measures list
-    for pivot in findall(root, 'saw:views/saw:view[@xsi:type="saw:pivotTableView"]'):
-        view_name = normalize_view_name(get_attr(pivot, 'name'))
+    for pivot in views_by_type['saw:pivotTableView']:
+        view_name = intern(normalize_view_name(get_attr(pivot, 'name')))
         for measure in findall(pivot, 'saw:measuresList/saw:measure'):
             measures_list_rows.append({
                 'report_file': report_name,
                 'view_name': view_name,
-                'column_id': get_attr(measure, 'columnID'),
-                'agg_rule': get_attr(measure, 'aggRule'),
+                'column_id': intern(get_attr(measure, 'columnID')),
+                'agg_rule': intern(get_attr(measure, 'aggRule')),
             })
     logger.info(f"Pivot measures list extracted: {len(measures_list_rows)} for '{report_name}'")
 
     # Charts and selections
-    for chart in findall(root, 'saw:views/saw:view[@xsi:type="saw:dvtchart"]'):
-        view_name = normalize_view_name(get_attr(chart, 'name'))
+    for chart in views_by_type['saw:dvtchart']:
+        view_name = intern(normalize_view_name(get_attr(chart, 'name')))
         display = find(chart, 'saw:display')
         style = find(chart, 'saw:display/saw:style')
         canvas = find(chart, 'saw:canvasFormat')
@@ -732,7 +826,7 @@ def parse_report(xml_path: str) -> Tuple[
             chart_category_rows.append({
                 'report_file': report_name,
                 'view_name': view_name,
-                'column_id': get_attr(col_ref, 'columnID'),
+                'column_id': intern(get_attr(col_ref, 'columnID')),
             })
         # Also treat seriesGenerators with columnRef as category dimensions (e.g., pie charts)
         for series_gen in findall(chart, 'saw:selections/saw:seriesGenerators/saw:seriesGenerator'):
@@ -741,7 +835,7 @@ def parse_report(xml_path: str) -> Tuple[
                 chart_category_rows.append({
                     'report_file': report_name,
                     'view_name': view_name,
-                    'column_id': get_attr(col_ref, 'columnID'),
+                    'column_id': intern(get_attr(col_ref, 'columnID')),
                 })
 
         # Measures
@@ -750,9 +844,9 @@ def parse_report(xml_path: str) -> Tuple[
             chart_measure_rows.append({
                 'report_file': report_name,
                 'view_name': view_name,
-                'measure_type': get_attr(meas, 'measureType'),
-                'riser_type': get_attr(meas, 'riserType'),
-                'column_id': get_attr(col_ref, 'columnID'),
+                'measure_type': intern(get_attr(meas, 'measureType')),
+                'riser_type': intern(get_attr(meas, 'riserType')),
+                'column_id': intern(get_attr(col_ref, 'columnID')),
             })
 
     logger.info(f"Charts extracted: {len(chart_rows)}; categories: {len(chart_category_rows)}; measures: {len(chart_measure_rows)} for '{report_name}'")
@@ -800,13 +894,20 @@ def parse_dashboard_layout(xml_path: str, dashboard_name: str = '') -> Tuple[Dic
         page_refs.append({
             'dashboard_name': dashboard_name,
             'page_path': get_attr(page_ref, 'path'),
-            'page_type': get_attr(page_ref, 'type'),
-            'hidden': get_attr(page_ref, 'hidden'),
+            'page_type': sys.intern(get_attr(page_ref, 'type')),
+            'hidden': sys.intern(get_attr(page_ref, 'hidden')),
         })
     
     logger.info(f"Dashboard layout parsed: {len(page_refs)} page references found")
     return dashboard_info, page_refs
 
+# Clark-notation tags of the dashboard page elements handled by parse_dashboard_page
+_SAWD_COLUMN = '{%s}dashboardColumn' % NAMESPACES['sawd']
+_SAWD_SECTION = '{%s}dashboardSection' % NAMESPACES['sawd']
+_SAWD_REPORT_VIEW = '{%s}reportView' % NAMESPACES['sawd']
+_SAWD_GLOBAL_FILTER_VIEW = '{%s}globalFilterView' % NAMESPACES['sawd']
+_SAWD_ACTION_LINK_VIEW = '{%s}actionLinkView' % NAMESPACES['sawd']
+
 def parse_dashboard_page(xml_path: str, page_name: str = '', dashboard_name: str = '', dashboard_duid: str = '') -> Tuple[
     Dict, List[Dict], List[Dict], List[Dict], List[Dict], List[Dict]
 ]:
@@ -815,119 +916,139 @@ def parse_dashboard_page(xml_path: str, page_name: str = '', dashboard_name: str
     Returns: (page_info, columns, sections, report_views, global_filters, action_links)
     """
     logger.info(f"Parsing dashboard page XML: {xml_path}")
-    try:
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
-    except Exception as exc:
-        logger.error(f"Failed to parse dashboard page XML '{xml_path}': {exc}")
-        raise
-    
-    # Extract page-level attributes
-    page_duid = get_attr(root, 'duid')
-    page_info = {
-        'dashboard_name': dashboard_name,
-        'page_name': page_name,
-        'page_file': xml_path,
-        'xml_version': get_attr(root, 'xmlVersion'),
-        'is_empty': get_attr(root, 'isEmpty'),
-        'duid': page_duid,
-        'parent_duid': dashboard_duid,
-    }
     
+    page_info = {}
     columns_list = []
     sections_list = []
     report_views_list = []
     global_filters_list = []
     action_links_list = []
     
-    # Extract dashboard columns
-    for col_idx, column in enumerate(findall(root, 'sawd:dashboardColumn')):
-        column_name = get_attr(column, 'name')
-        column_duid = get_attr(column, 'duid')
-        column_info = {
-            'dashboard_name': dashboard_name,
-            'page_name': page_name,
-            'column_name': column_name,
-            'column_index': col_idx,
-            'frozen': get_attr(column, 'frozen'),
-            'can_freeze': get_attr(column, 'canFreeze'),
-            'layout_type': get_attr(column, 'layoutType'),
-            'duid': column_duid,
-            'parent_duid': page_duid,
-        }
-        columns_list.append(column_info)
-        
-        # Extract sections within this column
-        for sec_idx, section in enumerate(findall(column, 'sawd:dashboardSection')):
-            section_name = get_attr(section, 'name')
-            section_duid = get_attr(section, 'duid')
-            section_info = {
-                'dashboard_name': dashboard_name,
-                'page_name': page_name,
-                'column_name': column_name,
-                'section_name': section_name,
-                'section_index': sec_idx,
-                'layout_type': get_attr(section, 'layoutType'),
-                'duid': section_duid,
-                'parent_duid': column_duid,
-                'show_section_title': get_attr(section, 'showSectionTitle'),
-                'collapsible': get_attr(section, 'collapsible'),
-                'horizontal_layout': get_attr(section, 'horizontalLayout'),
-            }
-            sections_list.append(section_info)
+    page_duid = ''
+    column_name = column_duid = ''
+    section_name = section_duid = ''
+    col_idx = sec_idx = rv_idx = gf_idx = al_idx = -1
+    # Tags of the currently open elements; only direct children are picked up at each level
+    open_tags = []
+    
+    # Stream the page: columns and sections are recorded on 'start' (attributes only),
+    # views on 'end' (they need their children) and each section is cleared once done
+    try:
+        for event, elem in ET.iterparse(xml_path, events=('start', 'end')):
+            if event == 'start':
+                open_tags.append(elem.tag)
+                depth = len(open_tags)
+                if depth == 1:
+                    # Extract page-level attributes
+                    page_duid = get_attr(elem, 'duid')
+                    page_info = {
+                        'dashboard_name': dashboard_name,
+                        'page_name': page_name,
+                        'page_file': xml_path,
+                        'xml_version': get_attr(elem, 'xmlVersion'),
+                        'is_empty': get_attr(elem, 'isEmpty'),
+                        'duid': page_duid,
+                        'parent_duid': dashboard_duid,
+                    }
+                elif depth == 2 and elem.tag == _SAWD_COLUMN:
+                    # Extract dashboard columns
+                    col_idx += 1
+                    sec_idx = -1
+                    column_name = sys.intern(get_attr(elem, 'name'))
+                    column_duid = get_attr(elem, 'duid')
+                    columns_list.append({
+                        'dashboard_name': dashboard_name,
+                        'page_name': page_name,
+                        'column_name': column_name,
+                        'column_index': col_idx,
+                        'frozen': get_attr(elem, 'frozen'),
+                        'can_freeze': get_attr(elem, 'canFreeze'),
+                        'layout_type': get_attr(elem, 'layoutType'),
+                        'duid': column_duid,
+                        'parent_duid': page_duid,
+                    })
+                elif depth == 3 and elem.tag == _SAWD_SECTION and open_tags[1] == _SAWD_COLUMN:
+                    # Extract sections within this column
+                    sec_idx += 1
+                    rv_idx = gf_idx = al_idx = -1
+                    section_name = sys.intern(get_attr(elem, 'name'))
+                    section_duid = get_attr(elem, 'duid')
+                    sections_list.append({
+                        'dashboard_name': dashboard_name,
+                        'page_name': page_name,
+                        'column_name': column_name,
+                        'section_name': section_name,
+                        'section_index': sec_idx,
+                        'layout_type': get_attr(elem, 'layoutType'),
+                        'duid': section_duid,
+                        'parent_duid': column_duid,
+                        'show_section_title': get_attr(elem, 'showSectionTitle'),
+                        'collapsible': get_attr(elem, 'collapsible'),
+                        'horizontal_layout': get_attr(elem, 'horizontalLayout'),
+                    })
+                continue
             
-            # Extract report views within this section
-            for rv_idx, report_view in enumerate(findall(section, 'sawd:reportView')):
-                caption_elem = find(report_view, 'saw:caption/saw:text')
+            depth = len(open_tags)
+            open_tags.pop()
+            if depth == 3 and elem.tag == _SAWD_SECTION and open_tags[1] == _SAWD_COLUMN:
+                # Section fully handled; drop its subtree
+                elem.clear()
+                continue
+            if depth != 4 or open_tags[1] != _SAWD_COLUMN or open_tags[2] != _SAWD_SECTION:
+                continue
+            
+            tag = elem.tag
+            if tag == _SAWD_REPORT_VIEW:
+                # Extract report views within this section
+                rv_idx += 1
+                caption_elem = find(elem, 'saw:caption/saw:text')
                 caption_text = text(caption_elem) if caption_elem is not None else ''
                 
-                report_ref = find(report_view, 'sawd:reportRef')
+                report_ref = find(elem, 'sawd:reportRef')
                 report_path = get_attr(report_ref, 'path') if report_ref is not None else ''
                 # Unescape forward slashes in report path (XML uses \/ for /)
                 report_path = report_path.replace('\\/', '/')
                 report_type = get_attr(report_ref, 'type') if report_ref is not None else ''
                 
-                report_view_info = {
+                report_views_list.append({
                     'dashboard_name': dashboard_name,
                     'page_name': page_name,
                     'page_file': xml_path,
                     'column_name': column_name,
                     'section_name': section_name,
-                    'report_view_name': get_attr(report_view, 'name'),
+                    'report_view_name': get_attr(elem, 'name'),
                     'report_view_index': rv_idx,
-                    'display': get_attr(report_view, 'display'),
-                    'show_view': get_attr(report_view, 'showView'),
-                    'duid': get_attr(report_view, 'duid'),
+                    'display': sys.intern(get_attr(elem, 'display')),
+                    'show_view': sys.intern(get_attr(elem, 'showView')),
+                    'duid': get_attr(elem, 'duid'),
                     'parent_duid': section_duid,
                     'caption': caption_text,
                     'report_path': report_path,
                     'report_type': report_type,
-                }
-                report_views_list.append(report_view_info)
-            
-            # Extract global filter views within this section
-            for gf_idx, global_filter in enumerate(findall(section, 'sawd:globalFilterView')):
-                caption_elem = find(global_filter, 'saw:caption/saw:text')
+                })
+            elif tag == _SAWD_GLOBAL_FILTER_VIEW:
+                # Extract global filter views within this section
+                gf_idx += 1
+                caption_elem = find(elem, 'saw:caption/saw:text')
                 caption_text = text(caption_elem) if caption_elem is not None else ''
                 
-                global_filter_info = {
+                global_filters_list.append({
                     'dashboard_name': dashboard_name,
                     'page_name': page_name,
                     'page_file': xml_path,
                     'column_name': column_name,
                     'section_name': section_name,
-                    'filter_name': get_attr(global_filter, 'name'),
+                    'filter_name': get_attr(elem, 'name'),
                     'filter_index': gf_idx,
-                    'filter_path': get_attr(global_filter, 'path'),
-                    'duid': get_attr(global_filter, 'duid'),
+                    'filter_path': get_attr(elem, 'path'),
+                    'duid': get_attr(elem, 'duid'),
                     'parent_duid': section_duid,
                     'caption': caption_text,
-                }
-                global_filters_list.append(global_filter_info)
-            
-            # Extract action link views within this section
-            for al_idx, action_link_view in enumerate(findall(section, 'sawd:actionLinkView')):
-                action_link = find(action_link_view, 'sawd:actionLink')
+                })
+            elif tag == _SAWD_ACTION_LINK_VIEW:
+                # Extract action link views within this section
+                al_idx += 1
+                action_link = find(elem, 'sawd:actionLink')
                 if action_link is not None:
                     caption_elem = find(action_link, 'saw:caption/saw:text')
                     caption_text = text(caption_elem) if caption_elem is not None else ''
@@ -938,23 +1059,25 @@ def parse_dashboard_page(xml_path: str, page_name: str = '', dashboard_name: str
                     if assign_elem is not None:
                         nav_path = text(assign_elem)
                     
-                    action_link_info = {
+                    action_links_list.append({
                         'dashboard_name': dashboard_name,
                         'page_name': page_name,
                         'page_file': xml_path,
                         'column_name': column_name,
                         'section_name': section_name,
-                        'action_link_name': get_attr(action_link_view, 'name'),
+                        'action_link_name': get_attr(elem, 'name'),
                         'action_link_index': al_idx,
-                        'duid': get_attr(action_link_view, 'duid'),
+                        'duid': get_attr(elem, 'duid'),
                         'parent_duid': section_duid,
                         'brief_book_link': get_attr(action_link, 'briefBookLink'),
                         'target': get_attr(action_link, 'target'),
                         'display_name': get_attr(action_link, 'sDisplayName'),
                         'caption': caption_text,
                         'navigation_path': nav_path,
-                    }
-                    action_links_list.append(action_link_info)
+                    })
+    except Exception as exc:
+        logger.error(f"Failed to parse dashboard page XML '{xml_path}': {exc}")
+        raise
     
     logger.info(f"Dashboard page parsed: {len(columns_list)} columns, {len(sections_list)} sections, "
                 f"{len(report_views_list)} report views, {len(global_filters_list)} global filters, "
@@ -962,11 +1085,21 @@ def parse_dashboard_page(xml_path: str, page_name: str = '', dashboard_name: str
     
     return page_info, columns_list, sections_list, report_views_list, global_filters_list, action_links_list
 
-def process_dashboard_directory(dashboard_dir: str, dashboard_name: str = '') -> Tuple[
+def _dashboard_file_exists(dashboard_dir: str, entries: set, name: str) -> bool:
+    """
+    True when name exists under dashboard_dir.
+    entries (the directory's file listing) answers plain file names without a stat; anything it
+    does not hold, such as a page in a subfolder or a name that is a directory, is checked on disk.
+    """
+    return name in entries or os.path.exists(os.path.join(dashboard_dir, name))
+
+def process_dashboard_directory(dashboard_dir: str, dashboard_name: str = '', filenames: List[str] = None) -> Tuple[
     List[Dict], List[Dict], List[Dict], List[Dict], List[Dict], List[Dict], List[Dict]
 ]:
     """
     Process a dashboard directory containing dashboard+layout.xml and page XML files.
+    filenames may carry the directory listing already read by the caller's walk (subfolders and files,
+    as os.listdir would return them); it is a hint, and names missing from it are checked on disk.
     Returns: (dashboards, page_refs, pages, columns, sections, report_views, global_filters, action_links)
     """
     logger.info(f"Processing dashboard directory: {dashboard_dir}")
@@ -974,6 +1107,8 @@ def process_dashboard_directory(dashboard_dir: str, dashboard_name: str = '') ->
     dashboards_list = []
     page_refs_list = []
     pages_list = []
+    # Names of the pages already in pages_list, for the standalone-page check below
+    seen_page_names = set()
     columns_list = []
     sections_list = []
     report_views_list = []
@@ -986,12 +1121,17 @@ def process_dashboard_directory(dashboard_dir: str, dashboard_name: str = '') ->
     
     dashboard_duid = ''
     
+    # Answer the file-existence probes below from one directory listing where possible
+    if filenames is None:
+        filenames = os.listdir(dashboard_dir) if os.path.isdir(dashboard_dir) else []
+    entries = set(filenames)
+    
     # Parse dashboard layout file (try with and without .xml extension)
-    layout_file = os.path.join(dashboard_dir, 'dashboard+layout.xml')
-    if not os.path.exists(layout_file):
-        layout_file = os.path.join(dashboard_dir, 'dashboard+layout')
+    layout_name = 'dashboard+layout.xml' if _dashboard_file_exists(dashboard_dir, entries, 'dashboard+layout.xml') \
+        else 'dashboard+layout'
+    layout_file = os.path.join(dashboard_dir, layout_name)
     
-    if os.path.exists(layout_file):
+    if _dashboard_file_exists(dashboard_dir, entries, layout_name):
         try:
             dashboard_info, page_refs = parse_dashboard_layout(layout_file, dashboard_name)
             dashboard_duid = dashboard_info.get('xml_version', '')  # Use xml_version as fallback if no duid
@@ -1005,16 +1145,17 @@ def process_dashboard_directory(dashboard_dir: str, dashboard_name: str = '') ->
                 page_filename = page_path.lower().replace(' ', '+')
                 
                 # Try with .xml extension first, then without
-                page_file = os.path.join(dashboard_dir, page_filename + '.xml')
-                if not os.path.exists(page_file):
-                    page_file = os.path.join(dashboard_dir, page_filename)
+                if _dashboard_file_exists(dashboard_dir, entries, page_filename + '.xml'):
+                    page_filename += '.xml'
+                page_file = os.path.join(dashboard_dir, page_filename)
                 
-                if os.path.exists(page_file):
+                if _dashboard_file_exists(dashboard_dir, entries, page_filename):
                     try:
                         page_info, columns, sections, report_views, global_filters, action_links = \
                             parse_dashboard_page(page_file, page_path, dashboard_name, dashboard_duid)
                         
                         pages_list.append(page_info)
+                        seen_page_names.add(page_info['page_name'])
                         columns_list.extend(columns)
                         sections_list.extend(sections)
                         report_views_list.extend(report_views)
@@ -1031,18 +1172,19 @@ def process_dashboard_directory(dashboard_dir: str, dashboard_name: str = '') ->
     
     # Also check for standalone page files (not referenced in layout)
     if os.path.isdir(dashboard_dir):
-        for fname in os.listdir(dashboard_dir):
+        for fname in filenames:
             if fname.lower().endswith('.xml') and fname != 'dashboard+layout.xml':
                 page_file = os.path.join(dashboard_dir, fname)
                 page_name = os.path.splitext(fname)[0].replace('+', ' ')
                 
                 # Check if this page was already processed
-                if not any(p['page_name'] == page_name for p in pages_list):
+                if page_name not in seen_page_names:
                     try:
                         page_info, columns, sections, report_views, global_filters, action_links = \
                             parse_dashboard_page(page_file, page_name, dashboard_name, dashboard_duid)
                         
                         pages_list.append(page_info)
+                        seen_page_names.add(page_info['page_name'])
                         columns_list.extend(columns)
                         sections_list.extend(sections)
                         report_views_list.extend(report_views)
@@ -1054,11 +1196,50 @@ def process_dashboard_directory(dashboard_dir: str, dashboard_name: str = '') ->
     logger.info(f"Dashboard directory processed: {len(dashboards_list)} dashboards, {len(pages_list)} pages")
     return dashboards_list, page_refs_list, pages_list, columns_list, sections_list, report_views_list, global_filters_list, action_links_list
 
-def process_all_dashboards_recursively(root_dir: str) -> Tuple[
+def _init_worker_logging(log_queue) -> None:
+    """
+    Route worker log records through a queue so only the parent writes the log file.
+    """
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    logger.addHandler(QueueHandler(log_queue))
+
+def _map_with_workers(func, tasks: List, workers: int = 1, chunksize: int = 4) -> List:
+    """
+    Apply func to each task, in a process pool when workers > 1.
+    Results come back in task order either way.
+    """
+    if workers <= 1 or len(tasks) <= 1:
+        return [func(task) for task in tasks]
+    log_queue = multiprocessing.Queue()
+    listener = QueueListener(log_queue, *logger.handlers, respect_handler_level=True)
+    listener.start()
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker_logging,
+                                 initargs=(log_queue,)) as ex:
+            return list(ex.map(func, tasks, chunksize=chunksize))
+    finally:
+        listener.stop()
+
+def _process_dashboard_task(task: Tuple[str, str, List[str]]):
+    """
+    Process one dashboard directory for process_all_dashboards_recursively.
+    Returns the process_dashboard_directory tuple, or None if the directory failed.
+    """
+    dirpath, dashboard_name, filenames = task
+    try:
+        logger.info(f"Found dashboard in: {dirpath}")
+        return process_dashboard_directory(dirpath, dashboard_name, filenames)
+    except Exception as exc:
+        logger.warning(f"Failed to process dashboard directory '{dirpath}': {exc}")
+        return None
+
+def process_all_dashboards_recursively(root_dir: str, workers: int = 1) -> Tuple[
     List[Dict], List[Dict], List[Dict], List[Dict], List[Dict], List[Dict], List[Dict]
 ]:
     """
     Recursively process all dashboard directories and XML files in root_dir.
+    With workers > 1 the dashboard directories are processed in a process pool; results keep the scan order.
     Returns: (dashboards, page_refs, pages, columns, sections, report_views, global_filters, action_links)
     """
     logger.info(f"Recursively scanning for dashboards in: {root_dir}")
@@ -1076,7 +1257,8 @@ def process_all_dashboards_recursively(root_dir: str) -> Tuple[
         logger.warning(f"Directory not found: {root_dir}")
         return agg_dashboards, agg_page_refs, agg_pages, agg_columns, agg_sections, agg_report_views, agg_global_filters, agg_action_links
     
-    # Walk through all directories recursively
+    # Walk through all directories recursively (os.walk lists each directory once via scandir)
+    tasks = []
     for dirpath, dirnames, filenames in os.walk(root_dir):
         # Check if this directory contains a dashboard+layout file (with or without .xml extension)
         has_dashboard = False
@@ -1089,96 +1271,139 @@ def process_all_dashboards_recursively(root_dir: str) -> Tuple[
             dashboard_name = rel_path.replace(os.sep, '/')
             if dashboard_name == '.':
                 dashboard_name = 'root'
-            
-            try:
-                logger.info(f"Found dashboard in: {dirpath}")
-                dashboards, page_refs, pages, columns, sections, report_views, global_filters, action_links = \
-                    process_dashboard_directory(dirpath, dashboard_name)
-                
-                agg_dashboards.extend(dashboards)
-                agg_page_refs.extend(page_refs)
-                agg_pages.extend(pages)
-                agg_columns.extend(columns)
-                agg_sections.extend(sections)
-                agg_report_views.extend(report_views)
-                agg_global_filters.extend(global_filters)
-                agg_action_links.extend(action_links)
-            except Exception as exc:
-                logger.warning(f"Failed to process dashboard directory '{dirpath}': {exc}")
+            # Hand over the full listing: os.walk splits subfolders out of filenames, and the
+            # standalone-page scan must see the same entries os.listdir would return
+            tasks.append((dirpath, dashboard_name, dirnames + filenames))
+    
+    for result in _map_with_workers(_process_dashboard_task, tasks, workers, chunksize=1):
+        if result is None:
+            continue
+        dashboards, page_refs, pages, columns, sections, report_views, global_filters, action_links = result
+        agg_dashboards.extend(dashboards)
+        agg_page_refs.extend(page_refs)
+        agg_pages.extend(pages)
+        agg_columns.extend(columns)
+        agg_sections.extend(sections)
+        agg_report_views.extend(report_views)
+        agg_global_filters.extend(global_filters)
+        agg_action_links.extend(action_links)
     
     logger.info(f"Recursive scan complete: {len(agg_dashboards)} dashboards found")
     return agg_dashboards, agg_page_refs, agg_pages, agg_columns, agg_sections, agg_report_views, agg_global_filters, agg_action_links
 
-def build_filter_expression_string(expr_elem) -> str:
+def _build_logical_expression(expr_elem, op: str) -> str:
+    """
+    AND/OR node: join the parenthesised child expressions with the operator.
+    Nested AND/OR children are walked with an explicit stack rather than by recursion.
+    """
+    # Each frame: (operator, remaining children, parenthesised child strings so far)
+    stack = [(op, iter(findall(expr_elem, 'sawx:expr')), [])]
+    while True:
+        node_op, children, child_strings = stack[-1]
+        child = next(children, None)
+        if child is None:
+            stack.pop()
+            joined = f" {node_op.upper()} ".join(child_strings) if child_strings else ''
+            if not stack:
+                return joined
+            if joined:
+                stack[-1][2].append(f"({joined})")
+            continue
+        
+        child_op, builder = _filter_expression_builder(child)
+        if builder is _build_logical_expression:
+            stack.append((child_op, iter(findall(child, 'sawx:expr')), []))
+            continue
+        child_str = builder(child, child_op) if builder is not None else ''
+        if child_str:
+            child_strings.append(f"({child_str})")
+
+def _build_in_list_expression(expr_elem, op: str) -> str:
     """
-    Recursively build a consolidated filter expression string from XML.
-    Returns a human-readable filter expression with logical operators.
+    IN node: first child is the column, the rest are the listed values.
     """
-    if expr_elem is None:
-        return ''
-    
-    op = get_attr(expr_elem, 'op', '')
-    expr_type = strip_prefix(get_attr(expr_elem, '{%s}type' % NAMESPACES['xsi']), 'sawx:')
-    
-    # Handle logical operators (and, or) - recursively process children
-    if expr_type == 'logical' and op in ('and', 'or'):
-        child_exprs = findall(expr_elem, 'sawx:expr')
-        child_strings = []
-        for child in child_exprs:
-            child_str = build_filter_expression_string(child)
-            if child_str:
-                child_strings.append(f"({child_str})")
-        
-        if child_strings:
-            return f" {op.upper()} ".join(child_strings)
-        return ''
-    
-    # Handle list operators (in) - must check before comparison
-    elif expr_type == 'list' and op == 'in':
-        child_exprs = findall(expr_elem, 'sawx:expr')
-        if len(child_exprs) >= 1:
-            column = text(child_exprs[0])
-            values = [text(child) for child in child_exprs[1:]]
-            if values:
-                values_str = ', '.join(values)
-                return f"{column} IN ({values_str})"
-            else:
-                return f"{column} IN ()"
-        return ''
-    
-    # Handle comparison operators
-    elif expr_type == 'comparison' or op in ('equal', 'in', 'greaterOrEqual', 'lessOrEqual', 'notEqual', 'greater', 'less'):
-        child_exprs = findall(expr_elem, 'sawx:expr')
-        if len(child_exprs) >= 2:
-            # Extract left side - handle columnExpression type
-            left_type = strip_prefix(get_attr(child_exprs[0], '{%s}type' % NAMESPACES['xsi']), 'sawx:')
-            if left_type == 'columnExpression':
-                # Extract from nested columnFormula
-                formula_elem = find(child_exprs[0], 'saw:columnFormula/sawx:expr')
-                if formula_elem is not None:
-                    left = text(formula_elem)
-                else:
-                    left = text(child_exprs[0])
+    child_exprs = findall(expr_elem, 'sawx:expr')
+    if len(child_exprs) >= 1:
+        column = text(child_exprs[0])
+        values = [text(child) for child in child_exprs[1:]]
+        if values:
+            values_str = ', '.join(values)
+            return f"{column} IN ({values_str})"
+        else:
+            return f"{column} IN ()"
+    return ''
+
+_COMPARISON_OPS = frozenset(('equal', 'in', 'greaterOrEqual', 'lessOrEqual', 'notEqual', 'greater', 'less'))
+_COMPARISON_OP_SYMBOLS = {'equal': '=', 'notEqual': '!=', 'greaterOrEqual': '>=', 'lessOrEqual': '<=', 'greater': '>', 'less': '<'}
+
+def _build_comparison_expression(expr_elem, op: str) -> str:
+    """
+    Comparison node: 'left op right', with the left side unwrapped from a columnExpression.
+    """
+    child_exprs = findall(expr_elem, 'sawx:expr')
+    if len(child_exprs) >= 2:
+        # Extract left side - handle columnExpression type
+        left_type = strip_prefix(get_attr(child_exprs[0], _XSI_TYPE), 'sawx:')
+        if left_type == 'columnExpression':
+            # Extract from nested columnFormula
+            formula_elem = find(child_exprs[0], 'saw:columnFormula/sawx:expr')
+            if formula_elem is not None:
+                left = text(formula_elem)
             else:
                 left = text(child_exprs[0])
-            
-            right = text(child_exprs[1])
-            op_symbol = {'equal': '=', 'notEqual': '!=', 'greaterOrEqual': '>=', 'lessOrEqual': '<=', 'greater': '>', 'less': '<'}.get(op, op)
-            return f"{left} {op_symbol} {right}"
-        elif len(child_exprs) == 1:
-            # Single child expression (shouldn't happen but handle it)
-            return text(child_exprs[0])
-        return ''
+        else:
+            left = text(child_exprs[0])
+        
+        right = text(child_exprs[1])
+        op_symbol = _COMPARISON_OP_SYMBOLS.get(op, op)
+        return f"{left} {op_symbol} {right}"
+    elif len(child_exprs) == 1:
+        # Single child expression (shouldn't happen but handle it)
+        return text(child_exprs[0])
+    return ''
+
+def _build_prompted_expression(expr_elem, op: str) -> str:
+    """
+    'is prompted' node: the column followed by IS PROMPTED.
+    """
+    child_exprs = findall(expr_elem, 'sawx:expr')
+    if len(child_exprs) >= 1:
+        column = text(child_exprs[0])
+        return f"{column} IS PROMPTED"
+    return ''
+
+# (expression type, op) -> builder; anything else typed 'comparison' or using a
+# comparison op falls back to _build_comparison_expression
+_FILTER_EXPRESSION_BUILDERS = {
+    ('logical', 'and'): _build_logical_expression,
+    ('logical', 'or'): _build_logical_expression,
+    # list operators (in) take precedence over the comparison fallback
+    ('list', 'in'): _build_in_list_expression,
+    ('special', 'prompted'): _build_prompted_expression,
+}
+
+def _filter_expression_builder(expr_elem) -> Tuple[str, object]:
+    """
+    Return (op, builder) for a filter expression node; builder is None for unsupported nodes.
+    """
+    op = get_attr(expr_elem, 'op', '')
+    expr_type = strip_prefix(get_attr(expr_elem, _XSI_TYPE), 'sawx:')
     
-    # Handle special operators like prompted
-    elif expr_type == 'special' and op == 'prompted':
-        child_exprs = findall(expr_elem, 'sawx:expr')
-        if len(child_exprs) >= 1:
-            column = text(child_exprs[0])
-            return f"{column} IS PROMPTED"
+    builder = _FILTER_EXPRESSION_BUILDERS.get((expr_type, op))
+    if builder is None and (expr_type == 'comparison' or op in _COMPARISON_OPS):
+        builder = _build_comparison_expression
+    return op, builder
+
+def build_filter_expression_string(expr_elem) -> str:
+    """
+    Build a consolidated filter expression string from XML.
+    Returns a human-readable filter expression with logical operators.
+    """
+    if expr_elem is None:
         return ''
     
-    return ''
+    op, builder = _filter_expression_builder(expr_elem)
+    return builder(expr_elem, op) if builder is not None else ''
 
 def parse_filter_expression(expr_elem) -> List[Dict]:
     """
@@ -1196,24 +1421,23 @@ def parse_filter_expression(expr_elem) -> List[Dict]:
     
     # Get the top-level operator
     op = get_attr(expr_elem, 'op', '')
-    expr_type = strip_prefix(get_attr(expr_elem, '{%s}type' % NAMESPACES['xsi']), 'sawx:')
+    expr_type = strip_prefix(get_attr(expr_elem, _XSI_TYPE), 'sawx:')
     
     # Extract all unique column names and table names from the expression
     all_columns = set()
     all_tables = set()
     
-    def extract_columns_tables(elem):
-        """Recursively extract column and table names"""
-        for child in findall(elem, './/sawx:expr[@xsi:type="sawx:sqlExpression"]'):
-            expr_text = text(child)
-            if expr_text and '"' in expr_text:
-                parts = expr_text.split('"')
-                if len(parts) >= 2:
-                    all_tables.add(parts[1])
-                if len(parts) >= 4:
-                    all_columns.add(parts[3])
-    
-    extract_columns_tables(expr_elem)
+    # One walk over the descendant sawx:expr elements, picking out the SQL expressions
+    for child in expr_elem.iter(_SAWX_EXPR):
+        if child is expr_elem or child.get(_XSI_TYPE) != 'sawx:sqlExpression':
+            continue
+        expr_text = text(child)
+        if expr_text and '"' in expr_text:
+            parts = expr_text.split('"')
+            if len(parts) >= 2:
+                all_tables.add(parts[1])
+            if len(parts) >= 4:
+                all_columns.add(parts[3])
     
     return [{
         'operator': op,
@@ -1224,6 +1448,32 @@ def parse_filter_expression(expr_elem) -> List[Dict]:
         'filter_value': '',
     }]
 
+# Clark-notation tags of the direct children of a saw:prompt read by parse_global_filter_prompt
+_SAW_FORMULA = '{%s}formula' % NAMESPACES['saw']
+_SAW_PROMPT_OPERATOR = '{%s}promptOperator' % NAMESPACES['saw']
+_SAW_LABEL = '{%s}label' % NAMESPACES['saw']
+_SAW_PROMPT_UI_CONTROL = '{%s}promptUIControl' % NAMESPACES['saw']
+_SAW_PROMPT_DEFAULT_VALUES = '{%s}promptDefaultValues' % NAMESPACES['saw']
+_SAW_CONSTRAIN_PROMPT = '{%s}constrainPrompt' % NAMESPACES['saw']
+_SAW_SET_PROMPT_VARIABLES = '{%s}setPromptVariables' % NAMESPACES['saw']
+_SAW_PROMPT_SOURCE = '{%s}promptSource' % NAMESPACES['saw']
+
+def _first_or_none(elems: List[ET.Element]) -> ET.Element:
+    """
+    First element of a list, or None when it is empty.
+    """
+    return elems[0] if elems else None
+
+def _find_first(elems: List[ET.Element], path: str) -> ET.Element:
+    """
+    find() across several sibling elements: the first match in document order, or None.
+    """
+    for elem in elems:
+        found = find(elem, path)
+        if found is not None:
+            return found
+    return None
+
 def parse_global_filter_prompt(xml_path: str) -> Tuple[str, str, List[Dict]]:
     """
     Parse a global filter prompt XML file and extract prompt details.
@@ -1239,7 +1489,7 @@ def parse_global_filter_prompt(xml_path: str) -> Tuple[str, str, List[Dict]]:
         root = tree.getroot()
         
         # Extract view type from root element (e.g., globalFilterPrompt)
-        view_type = strip_prefix(get_attr(root, '{%s}type' % NAMESPACES['xsi']), 'saw:')
+        view_type = strip_prefix(get_attr(root, _XSI_TYPE), 'saw:')
         
         # Extract subject area
         prompts_elem = find(root, 'saw:prompts')
@@ -1254,15 +1504,21 @@ def parse_global_filter_prompt(xml_path: str) -> Tuple[str, str, List[Dict]]:
         
         # Extract individual prompts
         for prompt in findall(root, './/saw:prompt'):
-            prompt_type = strip_prefix(get_attr(prompt, '{%s}type' % NAMESPACES['xsi']), 'saw:')
+            prompt_type = strip_prefix(get_attr(prompt, _XSI_TYPE), 'saw:')
             column_id = get_attr(prompt, 'columnID', '')
             required = get_attr(prompt, 'required', 'false')
             
+            # Bucket the prompt's direct children by tag in one pass; the lookups below read from it
+            children_by_tag = defaultdict(list)
+            for child in prompt:
+                children_by_tag[child.tag].append(child)
+            
             # Extract formula/expression
             # Handle different formula types: sqlExpression, columnExpression
-            formula_elem = find(prompt, 'saw:formula/sawx:expr')
+            formulas = children_by_tag[_SAW_FORMULA]
+            formula_elem = _find_first(formulas, 'sawx:expr')
             if formula_elem is not None:
-                expr_type = strip_prefix(get_attr(formula_elem, '{%s}type' % NAMESPACES['xsi']), 'sawx:')
+                expr_type = strip_prefix(get_attr(formula_elem, _XSI_TYPE), 'sawx:')
                 if expr_type == 'columnExpression':
                     # For columnExpression, extract the display formula
                     display_formula = find(formula_elem, 'saw:columnFormula[@formulaUse="display"]/sawx:expr')
@@ -1275,7 +1531,7 @@ def parse_global_filter_prompt(xml_path: str) -> Tuple[str, str, List[Dict]]:
                     expression = text(formula_elem)
             else:
                 # Try without namespace prefix
-                formula = find(prompt, 'saw:formula')
+                formula = _first_or_none(formulas)
                 if formula is not None:
                     # Get any child element
                     for child in formula:
@@ -1285,7 +1541,7 @@ def parse_global_filter_prompt(xml_path: str) -> Tuple[str, str, List[Dict]]:
                     expression = ''
             
             # Extract operator
-            operator_elem = find(prompt, 'saw:promptOperator')
+            operator_elem = _first_or_none(children_by_tag[_SAW_PROMPT_OPERATOR])
             if operator_elem is not None:
                 operator = get_attr(operator_elem, 'op', '')
             else:
@@ -1293,33 +1549,34 @@ def parse_global_filter_prompt(xml_path: str) -> Tuple[str, str, List[Dict]]:
             
             # Extract prompt name from label > caption > text
             prompt_name = ''
-            label_elem = find(prompt, 'saw:label/saw:caption/saw:text')
+            label_elem = _find_first(children_by_tag[_SAW_LABEL], 'saw:caption/saw:text')
             if label_elem is not None:
                 prompt_name = text(label_elem)
             
             # Extract UI control type and attributes
-            ui_control = find(prompt, 'saw:promptUIControl')
+            ui_control = _first_or_none(children_by_tag[_SAW_PROMPT_UI_CONTROL])
             control_type = ''
             max_choices = ''
             include_all_choices = ''
             if ui_control is not None:
-                control_type = strip_prefix(get_attr(ui_control, '{%s}type' % NAMESPACES['xsi']), 'saw:')
+                control_type = strip_prefix(get_attr(ui_control, _XSI_TYPE), 'saw:')
                 max_choices = get_attr(ui_control, 'maxChoices', '')
                 include_all_choices = get_attr(ui_control, 'includeAllChoices', '')
             
             # Extract default values with type and usingCodeValue
             default_values = []
-            default_values_elem = find(prompt, 'saw:promptDefaultValues')
+            default_values_elems = children_by_tag[_SAW_PROMPT_DEFAULT_VALUES]
+            default_values_elem = _first_or_none(default_values_elems)
             default_values_type = ''
             using_code_value = ''
             if default_values_elem is not None:
                 default_values_type = get_attr(default_values_elem, 'type', '')
                 using_code_value = get_attr(default_values_elem, 'usingCodeValue', '')
-                for default in findall(prompt, 'saw:promptDefaultValues/saw:promptDefaultValue'):
-                    default_values.append(text(default))
+                default_values = [text(default) for values_elem in default_values_elems
+                                  for default in findall(values_elem, 'saw:promptDefaultValue')]
             
             # Extract constrainPrompt
-            constrain_prompt_elem = find(prompt, 'saw:constrainPrompt')
+            constrain_prompt_elem = _first_or_none(children_by_tag[_SAW_CONSTRAIN_PROMPT])
             constrain_prompt_type = ''
             auto_select_value = ''
             if constrain_prompt_elem is not None:
@@ -1327,24 +1584,20 @@ def parse_global_filter_prompt(xml_path: str) -> Tuple[str, str, List[Dict]]:
                 auto_select_value = get_attr(constrain_prompt_elem, 'autoSelectValue', '')
             
             # Extract setPromptVariables - now as separate fields
-            prompt_var_locations = []
-            prompt_var_types = []
-            prompt_var_formulas = []
-            for var in findall(prompt, 'saw:setPromptVariables/saw:setPromptVariable'):
-                var_location = get_attr(var, 'location', '')
-                var_type = get_attr(var, 'type', '')
-                var_formula = get_attr(var, 'variableFormula', '')
-                prompt_var_locations.append(var_location)
-                prompt_var_types.append(var_type)
-                prompt_var_formulas.append(var_formula)
+            prompt_vars = [var for vars_elem in children_by_tag[_SAW_SET_PROMPT_VARIABLES]
+                           for var in findall(vars_elem, 'saw:setPromptVariable')]
+            prompt_var_locations = [get_attr(var, 'location', '') for var in prompt_vars]
+            prompt_var_types = [get_attr(var, 'type', '') for var in prompt_vars]
+            prompt_var_formulas = [get_attr(var, 'variableFormula', '') for var in prompt_vars]
             
             # Extract promptSource with type, sourceFormula, and promptChoices
-            prompt_source_elem = find(prompt, 'saw:promptSource')
+            prompt_source_elems = children_by_tag[_SAW_PROMPT_SOURCE]
+            prompt_source_elem = _first_or_none(prompt_source_elems)
             prompt_source_type = ''
             prompt_choices = []
             source_formula = ''
             if prompt_source_elem is not None:
-                prompt_source_type = strip_prefix(get_attr(prompt_source_elem, '{%s}type' % NAMESPACES['xsi']), 'saw:')
+                prompt_source_type = strip_prefix(get_attr(prompt_source_elem, _XSI_TYPE), 'saw:')
                 
                 # For sqlPromptSource, extract sourceFormula attribute
                 if prompt_source_type == 'sqlPromptSource':
@@ -1352,7 +1605,9 @@ def parse_global_filter_prompt(xml_path: str) -> Tuple[str, str, List[Dict]]:
                 
                 # For specificChoices, extract prompt choices from saw:value
                 if prompt_source_type == 'specificChoices':
-                    for choice in findall(prompt, 'saw:promptSource/saw:promptChoices/saw:promptChoice'):
+                    choices = [choice for source_elem in prompt_source_elems
+                               for choice in findall(source_elem, 'saw:promptChoices/saw:promptChoice')]
+                    for choice in choices:
                         # Try to get text from caption > text first
                         choice_text_elem = find(choice, 'saw:caption/saw:text')
                         if choice_text_elem is not None:
@@ -1394,16 +1649,16 @@ def parse_global_filter_prompt(xml_path: str) -> Tuple[str, str, List[Dict]]:
                 'control_type': control_type,
                 'max_choices': max_choices,
                 'include_all_choices': include_all_choices,
-                'default_values': '|'.join(default_values) if default_values else '',
+                'default_values': '|'.join(default_values),
                 'default_values_type': default_values_type,
                 'using_code_value': using_code_value,
                 'constrain_prompt_type': constrain_prompt_type,
                 'auto_select_value': auto_select_value,
-                'prompt_var_location': '|'.join(prompt_var_locations) if prompt_var_locations else '',
-                'prompt_var_type': '|'.join(prompt_var_types) if prompt_var_types else '',
-                'prompt_var_formula': '|'.join(prompt_var_formulas) if prompt_var_formulas else '',
+                'prompt_var_location': '|'.join(prompt_var_locations),
+                'prompt_var_type': '|'.join(prompt_var_types),
+                'prompt_var_formula': '|'.join(prompt_var_formulas),
                 'prompt_source_type': prompt_source_type,
-                'prompt_choices': '|'.join(prompt_choices) if prompt_choices else '',
+                'prompt_choices': '|'.join(prompt_choices),
                 'source_formula': source_formula,
                 'table_name': table_name,
                 'column_name': column_name,
@@ -1416,10 +1671,41 @@ def parse_global_filter_prompt(xml_path: str) -> Tuple[str, str, List[Dict]]:
     
     return view_type, instruction, prompts
 
-def process_all_reports_recursively(root_dir: str) -> Dict[str, Dict]:
+def _parse_catalog_file(task: Tuple[str, bool, bool]) -> Tuple[str, object]:
+    """
+    Parse one catalog file as a prompt and/or report.
+    Returns ('prompt', (view_type, instruction, prompt_data)), ('report', report_data) or (None, None).
+    Kept at module level so it can be shipped to worker processes.
+    """
+    fpath, try_prompt, try_report = task
+    # Try to parse as global filter prompt first (check filename or if in prompts directory)
+    if try_prompt:
+        try:
+            # Attempting to parse prompt file
+            view_type, instruction, prompt_data = parse_global_filter_prompt(fpath)
+            if prompt_data:
+                return 'prompt', (view_type, instruction, prompt_data)
+        except Exception as exc:
+            # Not a prompt file
+            pass
+
+    # Try to parse as report XML
+    if try_report:
+        try:
+            # Attempting to parse report file
+            report_data = parse_report(fpath)
+            if report_data:
+                return 'report', report_data
+        except Exception as exc:
+            # Skipping non-report file
+            pass
+    return None, None
+
+def process_all_reports_recursively(root_dir: str, workers: int = 1) -> Dict[str, Dict]:
     """
     Recursively scan for report XML files (excluding .atr files and dashboard files) and parse them.
     Returns a dictionary mapping report_path -> report_data
+    With workers > 1 the files are parsed in a process pool; results keep the scan order.
     """
     logger.info(f"Recursively scanning for report XMLs in: {root_dir}")
     
@@ -1430,155 +1716,198 @@ def process_all_reports_recursively(root_dir: str) -> Dict[str, Dict]:
         logger.warning(f"Directory not found: {root_dir}")
         return reports_map
     
-    # Walk through all directories recursively
+    # Walk through all directories recursively and collect the files to parse
+    candidates = []
+    # os.walk reads each directory once through os.scandir; per-directory work is hoisted out of the file loop
     for dirpath, dirnames, filenames in os.walk(root_dir):
+        # Relative catalog prefix of this directory ('' at the root), in '/' form
+        rel_dir = os.path.relpath(dirpath, root_dir)
+        rel_prefix = '' if rel_dir == '.' else rel_dir.replace(os.sep, '/') + '/'
+        in_prompt_dir = 'prompt' in dirpath.lower()
         for fname in filenames:
+            fname_lower = fname.lower()
             # Skip .atr files and dashboard-related files
-            if fname.endswith('.atr') or 'page+' in fname.lower():
+            if fname.endswith('.atr') or 'page+' in fname_lower:
                 continue
             
             # Process XML files (with or without extension)
             fpath = os.path.join(dirpath, fname)
             
-            # Get relative path from root for report_path
-            rel_path = os.path.relpath(fpath, root_dir)
             # Convert to catalog path format: /shared/... 
             # First replace + with spaces, then URL-decode to handle %2e, %2f, etc.
-            report_path = '/' + rel_path.replace(os.sep, '/').replace('+', ' ')
-            report_path = unquote(report_path)
+            report_path = '/' + (rel_prefix + fname).replace('+', ' ')
+            if '%' in report_path:
+                report_path = unquote(report_path)
             # Remove file extension if present
             if report_path.endswith('.xml'):
                 report_path = report_path[:-4]
             
-            # Try to parse as global filter prompt first (check filename or if in prompts directory)
-            if 'prompt' in fname.lower() or 'prompt' in dirpath.lower():
-                try:
-                    # Attempting to parse prompt file
-                    view_type, instruction, prompt_data = parse_global_filter_prompt(fpath)
-                    if prompt_data:
-                        prompts_map[report_path] = {
-                            'file_path': fpath,
-                            'prompt_path': report_path,
-                            'view_type': view_type,
-                            'instruction': instruction,
-                            'prompt_data': prompt_data
-                        }
-                        logger.info(f"Parsed prompt: {report_path}")
-                        continue
-                except Exception as exc:
-                    # Not a prompt file
-                    pass
-            
-            # Try to parse as report XML
+            try_prompt = 'prompt' in fname_lower or in_prompt_dir
             # Skip dashboard layout/page files but allow reports with "dashboard" in the name
-            if 'dashboard+layout' not in fname.lower() and not fname.lower().startswith('page+'):
-                try:
-                    # Attempting to parse report file
-                    report_data = parse_report(fpath)
-                    
-                    if report_data:
-                        reports_map[report_path] = {
-                            'file_path': fpath,
-                            'report_path': report_path,
-                            'report_data': report_data
-                        }
-                        logger.info(f"Parsed report: {report_path}")
-                except Exception as exc:
-                    # Skipping non-report file
-                    continue
+            try_report = 'dashboard+layout' not in fname_lower and not fname_lower.startswith('page+')
+            candidates.append((fpath, report_path, try_prompt, try_report))
+    
+    tasks = [(fpath, try_prompt, try_report) for fpath, _, try_prompt, try_report in candidates]
+    results = _map_with_workers(_parse_catalog_file, tasks, workers)
+    
+    for (fpath, report_path, _, _), (kind, payload) in zip(candidates, results):
+        if kind == 'prompt':
+            view_type, instruction, prompt_data = payload
+            prompts_map[report_path] = {
+                'file_path': fpath,
+                'prompt_path': report_path,
+                'view_type': view_type,
+                'instruction': instruction,
+                'prompt_data': prompt_data
+            }
+            logger.info(f"Parsed prompt: {report_path}")
+        elif kind == 'report':
+            reports_map[report_path] = {
+                'file_path': fpath,
+                'report_path': report_path,
+                'report_data': payload
+            }
+            logger.info(f"Parsed report: {report_path}")
     
     logger.info(f"Found and parsed {len(reports_map)} reports and {len(prompts_map)} prompts")
     return reports_map, prompts_map
 
-def create_dashboard_csv_data(agg_dashboard_report_views, agg_dashboard_global_filters, agg_dashboard_action_links):
+@lru_cache(maxsize=None)
+def _dashboard_display_info(dashboard_name: str) -> Tuple[str, str]:
     """
-    Create Dashboard CSV with standardized naming and paths
+    Return (display name, catalog path) for a raw dashboard name such as 'shared/hr/_portal/hr+dashboard'.
+    Many rows share a dashboard, so each name is resolved once.
+    """
+    return (unquote(dashboard_name.rpartition('/')[2].replace('+', ' ')),
+            dashboard_name_to_catalog_path(dashboard_name))
+
+# Dashboards.csv column order; iter_dashboard_csv_rows emits tuples in this order
+_DASHBOARD_HEADER = ('WorksheetName', 'DashboardName', 'ObjectName', 'ObjectType', 'ObjectPath', 'WorksheetPath', 'DashboardPath')
+
+def iter_dashboard_csv_rows(agg_dashboard_report_views, agg_dashboard_global_filters, agg_dashboard_action_links):
+    """
+    Yield Dashboard CSV rows with standardized naming and paths
+    Rows are tuples in _DASHBOARD_HEADER order, produced lazily so they can be streamed to the writer
     """
-    dashboard_rows = []
-    
-    # Add report views
-    for rv in agg_dashboard_report_views:
-        page_file = rv.get('page_file', '')
-        worksheet_path = file_path_to_catalog_path(page_file, os.path.join(os.path.dirname(__file__), '..', 'input_xml')) if page_file else ''
-        
-        dashboard_rows.append({
-            'WorksheetName': rv.get('page_name', ''),
-            'DashboardName': unquote(rv.get('dashboard_name', '').replace('+', ' ').split("/")[-1]),
-            'ObjectName': rv.get('caption', ''),
-            'ObjectType': 'Reports',
-            'ObjectPath': rv.get('report_path', ''),
-            'WorksheetPath': worksheet_path,
-            'DashboardPath': dashboard_name_to_catalog_path(rv.get('dashboard_name', '')),
-        })
-    
-    # Add global filters/prompts
-    for gf in agg_dashboard_global_filters:
-        page_file = gf.get('page_file', '')
-        worksheet_path = file_path_to_catalog_path(page_file, os.path.join(os.path.dirname(__file__), '..', 'input_xml')) if page_file else ''
-        
-        dashboard_rows.append({
-            'WorksheetName': gf.get('page_name', ''),
-            'DashboardName': unquote(gf.get('dashboard_name', '').replace('+', ' ').split("/")[-1]),
-            'ObjectName': gf.get('caption', ''),
-            'ObjectType': 'Prompts',
-            'ObjectPath': gf.get('filter_path', ''),
-            'WorksheetPath': worksheet_path,
-            'DashboardPath': dashboard_name_to_catalog_path(gf.get('dashboard_name', '')),
-        })
-    
-    # Add action links
-    for al in agg_dashboard_action_links:
-        page_file = al.get('page_file', '')
-        worksheet_path = file_path_to_catalog_path(page_file, os.path.join(os.path.dirname(__file__), '..', 'input_xml')) if page_file else ''
-        
-        dashboard_rows.append({
-            'WorksheetName': al.get('page_name', ''),
-            'DashboardName':  unquote(al.get('dashboard_name', '').replace('+', ' ').split("/")[-1]),
-            'ObjectName': al.get('caption', ''),
-            'ObjectType': 'Links',
-            'ObjectPath': al.get('navigation_path', ''),
-            'WorksheetPath': worksheet_path,
-            'DashboardPath': dashboard_name_to_catalog_path(al.get('dashboard_name', '')),
-        })
     
-    return dashboard_rows
+    # Report views, global filters/prompts and action links, each with its object type and path key
+    for items, object_type, path_key in (
+        (agg_dashboard_report_views, 'Reports', 'report_path'),
+        (agg_dashboard_global_filters, 'Prompts', 'filter_path'),
+        (agg_dashboard_action_links, 'Links', 'navigation_path'),
+    ):
+        for item in items:
+            page_file = item.get('page_file', '')
+            worksheet_path = file_path_to_catalog_path(page_file, _INPUT_XML_ROOT) if page_file else ''
+            dashboard_display_name, dashboard_catalog_path = _dashboard_display_info(item.get('dashboard_name', ''))
+            
+            yield (
+                item.get('page_name', ''),
+                dashboard_display_name,
+                item.get('caption', ''),
+                object_type,
+                item.get(path_key, ''),
+                worksheet_path,
+                dashboard_catalog_path,
+            )
+
+def create_dashboard_csv_data(agg_dashboard_report_views, agg_dashboard_global_filters, agg_dashboard_action_links):
+    """
+    Create Dashboard CSV rows as a list (see iter_dashboard_csv_rows).
+    Kept for callers that need the rows materialised; main streams the generator instead.
+    """
+    return list(iter_dashboard_csv_rows(agg_dashboard_report_views, agg_dashboard_global_filters,
+                                        agg_dashboard_action_links))
 
-def create_worksheets_csv_data(agg_dashboard_report_views, reports_map):
+def _build_report_indexes(reports_map) -> Tuple[Dict, Dict]:
     """
-    Create Worksheets CSV with comprehensive dashboard page + report column details
+    Build case-insensitive report lookups in one pass over reports_map:
+    lower-cased full path -> report info, and lower-cased basename -> report info (first report wins).
+    """
+    reports_map_lower = {}
+    reports_by_basename_lower = {}
+    for k, v in reports_map.items():
+        reports_map_lower[k.lower()] = v
+        base = os.path.basename(k.strip('/')).lower()
+        if base and base not in reports_by_basename_lower:
+            reports_by_basename_lower[base] = v
+    return reports_map_lower, reports_by_basename_lower
+
+def _find_report_info(report_path: str, reports_map_lower: Dict, reports_by_basename_lower: Dict):
+    """
+    Resolve a dashboard report path to its report info (case-insensitive), or None.
+    Falls back to matching the last path segment when the full path is not found.
+    """
+    # URL-decode the report path to handle encoded characters like %2e (.)
+    decoded_report_path = unquote(report_path)
+    report_info = reports_map_lower.get(decoded_report_path.lower())
+    if not report_info:
+        # Fallback: match by last segment (report name) ignoring folders and case
+        base = os.path.basename(decoded_report_path.strip('/')).lower()
+        report_info = reports_by_basename_lower.get(base)
+    return report_info
+
+def _report_column_map(report_info: Dict, report_path: str, column_rows: List[Dict], cache: Dict) -> Dict:
+    """
+    column_id -> column row lookup for a report, built once and kept in cache.
+    Keyed by the report's file path (or report_path when the entry carries none).
+    """
+    key = report_info.get('file_path') or report_path
+    col_map = cache.get(key)
+    if col_map is None:
+        col_map = {col.get('column_id', ''): col for col in column_rows}
+        cache[key] = col_map
+    return col_map
+
+# "Table"."Column" pairs, VALUEOF(...) references and saw_N column ids inside column formulas
+_TABLE_COLUMN_PAIR_RE = re.compile(r'"([^"\\]+)"\s*\.\s*"([^"\\]+)"')
+_VALUEOF_RE = re.compile(r'VALUEOF\s*\(\s*([^)]+)\s*\)', re.IGNORECASE)
+_SAW_COLUMN_REF_RE = re.compile(r'saw_\d+')
+# Axis info for columns that are neither chart categories nor measures
+_NO_AXIS_INFO = (0, 0, '', '', '')
+# Worksheet rows are dropped when any table (or the exact pipe-joined table list) matches these, case-insensitively
+_BANNED_WORKSHEET_TABLES = frozenset({
+    'volume',
+    'key reporting fields',
+    'actual ship date additional information',
+    'invoice date additional information',
+    'scheduled pick date additional information',
+})
+_BANNED_WORKSHEET_TABLE_UNIONS = frozenset({
+    'scheduled pick date|transaction details|as of date',
+})
+
+def iter_worksheets_csv_rows(agg_dashboard_report_views, reports_map, report_indexes=None):
+    """
+    Yield Worksheets CSV rows with comprehensive dashboard page + report column details
     Includes X/Y axis info, derived column sources, and proper table/column list extraction
+    Rows are produced lazily so they can be streamed to the writer.
     """
-    worksheet_rows = []
     
-    # Create case-insensitive lookup maps (full path and basename fallbacks)
-    reports_map_lower = {k.lower(): v for k, v in reports_map.items()}
-    reports_by_basename_lower = {}
-    try:
-        for k, v in reports_map.items():
-            base = os.path.basename(k.strip('/')).lower()
-            if base and base not in reports_by_basename_lower:
-                reports_by_basename_lower[base] = v
-    except Exception:
-        pass
+    # Case-insensitive lookup maps (full path and basename fallbacks), shared by the builders when passed in
+    reports_map_lower, reports_by_basename_lower = report_indexes or _build_report_indexes(reports_map)
+    # report_path -> resolved report_info (or None); many report views embed the same report
+    report_info_by_path = {}
+    # Report file path -> column_id lookup for that report
+    col_map_by_report = {}
     
     for rv in agg_dashboard_report_views:
         page_name = rv.get('page_name', '')
         report_name = rv.get('caption', '')
         report_path = rv.get('report_path', '')
         report_view_name = rv.get('report_view_name', '')
-        dashboard_name = rv.get('dashboard_name', '').replace('+', ' ')
         dashboard_path = rv.get('dashboard_name', '')
+        # Same for every row emitted for this report view; resolved once per dashboard and shared
+        dashboard_display_name, dashboard_catalog_path = _dashboard_display_info(dashboard_path)
         page_file = rv.get('page_file', '')
-        worksheet_path = file_path_to_catalog_path(page_file, os.path.join(os.path.dirname(__file__), '..', 'input_xml')) if page_file else ''
+        worksheet_path = file_path_to_catalog_path(page_file, _INPUT_XML_ROOT) if page_file else ''
         
         # Find matching report in reports_map (case-insensitive)
-        # URL-decode the report path to handle encoded characters like %2e (.)
-        decoded_report_path = unquote(report_path)
-        report_info = reports_map_lower.get(decoded_report_path.lower())
-        if not report_info:
-            # Fallback: match by last segment (report name) ignoring folders and case
-            base = os.path.basename(decoded_report_path.strip('/')).lower()
-            report_info = reports_by_basename_lower.get(base)
+        if report_path in report_info_by_path:
+            report_info = report_info_by_path[report_path]
+        else:
+            report_info = _find_report_info(report_path, reports_map_lower, reports_by_basename_lower)
+            report_info_by_path[report_path] = report_info
         
         if report_info:
             report_data = report_info.get('report_data', ())
@@ -1595,15 +1924,18 @@ def create_worksheets_csv_data(agg_dashboard_report_views, reports_map):
                 if report_rows:
                     subject_area = report_rows[0].get('subject_area', '').strip('"')
                 
-                # Create column lookup
-                col_map = {col.get('column_id', ''): col for col in column_rows}
+                # Create column lookup (once per report)
+                col_map = _report_column_map(report_info, report_path, column_rows, col_map_by_report)
                 
                 # Determine which columns are in X/Y axis based on chart measures and categories
-                x_axis_cols = set(cat.get('column_id', '') for cat in chart_category_rows)
-                y_axis_cols = {}  # col_id -> (measure_type, riser_type)
+                # col_id -> (x_axis, y_axis, measure_type, riser_type, encoding); measures override categories
+                x_axis_cols = {cat.get('column_id', '') for cat in chart_category_rows}
+                axis_info = {col_id: (1, 0, '', '', 'category') for col_id in x_axis_cols}
                 for measure in chart_measure_rows:
                     col_id = measure.get('column_id', '')
-                    y_axis_cols[col_id] = (measure.get('measure_type', ''), measure.get('riser_type', ''))
+                    riser_type = measure.get('riser_type', '')
+                    axis_info[col_id] = (1 if col_id in x_axis_cols else 0, 1, measure.get('measure_type', ''),
+                                         riser_type, riser_type if riser_type else 'measure')
 
                 # Build aggregation rule lookup per (view_name, column_id)
                 # Combine from pivot measures list and edge layer specifications
@@ -1624,6 +1956,11 @@ def create_worksheets_csv_data(agg_dashboard_report_views, reports_map):
                             agg_by_map[key] = agg
                 except Exception:
                     pass
+                # First non-empty agg per column in agg_by_map order, for rows without a view context
+                agg_by_col: Dict[str, str] = {}
+                for (v_name, c_id), agg in agg_by_map.items():
+                    if agg and c_id not in agg_by_col:
+                        agg_by_col[c_id] = agg
 
                 normalized_view_name = normalize_view_name(report_view_name)
 
@@ -1649,32 +1986,32 @@ def create_worksheets_csv_data(agg_dashboard_report_views, reports_map):
                     expression = col.get('expression', '')
                     col_type = col.get('column_xsi_type', '')
                     expr_type = col.get('expr_xsi_type', '')
+                    # Upper-cased once for the VALUEOF / CASE keyword checks below
+                    expression_upper = expression.upper()
                     
                     # Parse expression to extract ALL table and column names (for formulas with multiple tables)
                     # Use a strict regex to match only patterns of the form "Table"."Column"
                     table_names: List[str] = []
                     column_names: List[str] = []
-                    if expression:
+                    # A quoted pair needs at least one '"', so skip the scan for bare expressions
+                    if expression and '"' in expression:
                         try:
                             # Find all pairs of "Table"."Column"
-                            pairs = re.findall(r'"([^"\\]+)"\s*\.\s*"([^"\\]+)"', expression)
+                            pairs = _TABLE_COLUMN_PAIR_RE.findall(expression)
                             if pairs:
                                 # Preserve order, but deduplicate while maintaining first occurrence
-                                seen_pairs = set()
-                                for t, c in pairs:
-                                    if (t, c) not in seen_pairs:
-                                        seen_pairs.add((t, c))
-                                        table_names.append(t)
-                                        column_names.append(c)
+                                for t, c in dict.fromkeys(pairs):
+                                    table_names.append(t)
+                                    column_names.append(c)
                         except Exception:
                             # If regex fails for any reason, fall back to headings below
                             table_names = []
                             column_names = []
                     
                     # Handle VALUEOF expressions like VALUEOF(NQ_SESSION.SAW_DASHBOARD)
-                    if 'VALUEOF' in expression.upper() and '.' in expression:
+                    if 'VALUEOF' in expression_upper and '.' in expression:
                         # Extract content within VALUEOF()
-                        valueof_match = re.search(r'VALUEOF\s*\(\s*([^)]+)\s*\)', expression, re.IGNORECASE)
+                        valueof_match = _VALUEOF_RE.search(expression)
                         if valueof_match:
                             valueof_content = valueof_match.group(1)
                             # Split by . to get table.column
@@ -1694,110 +2031,84 @@ def create_worksheets_csv_data(agg_dashboard_report_views, reports_map):
                             column_names.append(column_heading)
                     
                     # Determine X/Y axis info
-                    x_axis = 0
-                    y_axis = 0
-                    measure_type = ''
-                    riser_type = ''
-                    encoding = ''
+                    x_axis, y_axis, measure_type, riser_type, encoding = axis_info.get(col_id, _NO_AXIS_INFO)
                     # Prefer aggRule from the specific view if available; otherwise fall back to any view
                     summerized_by = agg_by_map.get((normalized_view_name, col_id), '')
                     if not summerized_by and not normalized_view_name:
                         # No specific view context (synthesized case): pick any non-empty agg for this column
-                        try:
-                            for (v_name, c_id), agg in agg_by_map.items():
-                                if c_id == col_id and agg:
-                                    summerized_by = agg
-                                    break
-                        except Exception:
-                            summerized_by = ''
-                    
-                    if col_id in x_axis_cols:
-                        x_axis = 1
-                        encoding = 'category'
-                    
-                    if col_id in y_axis_cols:
-                        y_axis = 1
-                        measure_type, riser_type = y_axis_cols[col_id]
-                        encoding = riser_type if riser_type else 'measure'
+                        summerized_by = agg_by_col.get(col_id, '')
                     
                     # For derived columns, identify source columns
                     source_column_ids: List[str] = []
                     source_expressions: List[str] = []
-                    is_derived = expr_type not in ['sqlExpression', ''] or 'CASE' in expression.upper() or '(' in expression
+                    is_derived = expr_type not in ('sqlExpression', '') or 'CASE' in expression_upper or '(' in expression
                     
                     if is_derived:
                         # Try to extract column IDs referenced in the expression
                         # Look for patterns like saw_0, saw_1, etc. or other column references
-                        col_refs = re.findall(r'saw_\d+', expression)
+                        col_refs = _SAW_COLUMN_REF_RE.findall(expression)
                         # Deduplicate and sort numerically by the integer suffix for deterministic order
-                        unique_refs = sorted(set(col_refs), key=lambda s: int(s.split('_')[1]) if '_' in s and s.split('_')[1].isdigit() else 0)
-                        source_column_ids = unique_refs
+                        # (the regex guarantees a 'saw_' prefix followed by digits)
+                        source_column_ids = sorted(dict.fromkeys(col_refs), key=lambda s: int(s[4:]))
                         # Map expressions in the same sorted order
                         for src_id in source_column_ids:
                             src_col = col_map.get(src_id, {})
                             source_expressions.append(src_col.get('expression', ''))
                     
                     # Build fields
-                    table_names_joined = '|'.join(table_names) if table_names else ''
+                    table_names_joined = '|'.join(table_names)
+                    # Lower-cased once for the IFERROR and banned-union checks below
+                    table_names_joined_lower = table_names_joined.lower()
                     # Skip any row where TableNames mistakenly contains IFERROR per requirement
-                    if 'IFERROR' in table_names_joined.upper():
+                    if 'iferror' in table_names_joined_lower:
                         continue
 
                     # Additional filter: skip rows if TableNames contains any banned table names
                     # Compare on individual table tokens, case-insensitive
-                    if table_names:
-                        banned_tables = {
-                            'volume',
-                            'key reporting fields',
-                            'actual ship date additional information',
-                            'invoice date additional information',
-                            'scheduled pick date additional information',
-                        }
-                        normalized_tables = {t.strip().lower() for t in table_names}
-                        if normalized_tables & banned_tables:
-                            continue
+                    if any(t.strip().lower() in _BANNED_WORKSHEET_TABLES for t in table_names):
+                        continue
 
                     # Additional filter: skip rows if the exact union of TableNames matches banned unions
                     # Compare case-insensitively on the full pipe-joined string
-                    if table_names_joined:
-                        banned_unions = {
-                            'scheduled pick date|transaction details|as of date',
-                        }
-                        if table_names_joined.strip().lower() in banned_unions:
-                            continue
+                    if table_names_joined_lower.strip() in _BANNED_WORKSHEET_TABLE_UNIONS:
+                        continue
 
+                    # Only ViewId varies across the rows emitted for this column
+                    row_template = {
+                        'WorksheetName': page_name,
+                        'DashboardName': dashboard_display_name,
+                        'ReportName': report_name,
+                        'ReportNameTag': report_view_name,
+                        'ViewId': '',
+                        'DataSourceName': subject_area,
+                        'TableNames': table_names_joined,
+                        'ColumnNames': '|'.join(column_names),
+                        'Formula': expression,
+                        'ColumnId': col_id,
+                        'ColumnType': col_type,
+                        'ExpressionType': expr_type,
+                        'X': x_axis,
+                        'Y': y_axis,
+                        'Encoding': encoding,
+                        'MeasureType': measure_type,
+                        'RiserType': riser_type,
+                        'Summerized_by': summerized_by,
+                        'IsDerived': 'Yes' if is_derived else 'No',
+                        'SourceColumnIds': '|'.join(source_column_ids),
+                        'SourceExpressions': '|'.join(source_expressions),
+                        'WorksheetPath': worksheet_path,
+                        'DashboardPath': dashboard_catalog_path,
+                        'ReportPath': report_path,
+                    }
                     for emit_view_id in ids_to_emit or ['']:
-                        worksheet_rows.append({
-                            'WorksheetName': page_name,
-                            'DashboardName': unquote(dashboard_name.replace('+', ' ').split("/")[-1]),
-                            'ReportName': report_name,
-                            'ReportNameTag': report_view_name,
-                            'ViewId': emit_view_id,
-                            'DataSourceName': subject_area,
-                            'TableNames': table_names_joined,
-                            'ColumnNames': '|'.join(column_names) if column_names else '',
-                            'Formula': expression,
-                            'ColumnId': col_id,
-                            'ColumnType': col_type,
-                            'ExpressionType': expr_type,
-                            'X': x_axis,
-                            'Y': y_axis,
-                            'Encoding': encoding,
-                            'MeasureType': measure_type,
-                            'RiserType': riser_type,
-                            'Summerized_by': summerized_by,
-                            'IsDerived': 'Yes' if is_derived else 'No',
-                            'SourceColumnIds': '|'.join(source_column_ids) if source_column_ids else '',
-                            'SourceExpressions': '|'.join(source_expressions) if source_expressions else '',
-                            'WorksheetPath': worksheet_path,
-                            'DashboardPath': dashboard_name_to_catalog_path(dashboard_path),
-                            'ReportPath': report_path,
-                        })
+                        row = row_template.copy()
+                        row['ViewId'] = emit_view_id
+                        yield row
         else:
             # Report not found, create placeholder row
-            worksheet_rows.append({
+            yield {
                 'WorksheetName': page_name,
-                'DashboardName': unquote(dashboard_name.replace('+', ' ').split("/")[-1]),
+                'DashboardName': dashboard_display_name,
                 'ReportName': report_name,
                 'ReportNameTag': report_view_name,
                 'ViewId': '',
@@ -1820,65 +2131,68 @@ def create_worksheets_csv_data(agg_dashboard_report_views, reports_map):
                 'WorksheetPath': worksheet_path,
                 'DashboardPath': dashboard_path,
                 'ReportPath': report_path,
-            })
-    
-    return worksheet_rows
+            }
 
-def create_charttype_csv_data(agg_dashboard_report_views, reports_map):
+def create_worksheets_csv_data(agg_dashboard_report_views, reports_map, report_indexes=None):
     """
-    Create ChartType CSV - extract only views that are in compound view, with correct chart types
+    Create Worksheets CSV rows as a list (see iter_worksheets_csv_rows).
+    Kept for callers that need the rows materialised; main streams the generator instead.
+    """
+    return list(iter_worksheets_csv_rows(agg_dashboard_report_views, reports_map, report_indexes))
+
+# ChartType.csv column order; iter_charttype_csv_rows emits tuples in this order
+_CHARTTYPE_HEADER = ('WorksheetName', 'DashboardName', 'ReportName', 'ReportNameTag',
+                     'ViewId', 'ViewType', 'ChartType', 'TitleText', 'IsCurrentView', 'Reason',
+                     'WorksheetPath', 'DashboardPath', 'ReportPath')
+
+def iter_charttype_csv_rows(agg_dashboard_report_views, reports_map, report_indexes=None):
+    """
+    Yield ChartType CSV rows - extract only views that are in compound view, with correct chart types
+    Rows are tuples in _CHARTTYPE_HEADER order, produced lazily so they can be streamed to the writer
     """
-    charttype_rows = []
     
-    # Create case-insensitive lookup maps (full path and basename fallbacks)
-    reports_map_lower = {k.lower(): v for k, v in reports_map.items()}
-    reports_by_basename_lower = {}
-    try:
-        for k, v in reports_map.items():
-            base = os.path.basename(k.strip('/')).lower()
-            if base and base not in reports_by_basename_lower:
-                reports_by_basename_lower[base] = v
-    except Exception:
-        pass
+    # Case-insensitive lookup maps (full path and basename fallbacks), shared by the builders when passed in
+    reports_map_lower, reports_by_basename_lower = report_indexes or _build_report_indexes(reports_map)
     
     for rv in agg_dashboard_report_views:
         page_name = rv.get('page_name', '')
         report_name = rv.get('caption', '')
         report_path = rv.get('report_path', '')
         report_view_name = rv.get('report_view_name', '')
-        dashboard_name = rv.get('dashboard_name', '').replace('+', ' ')
         dashboard_path = rv.get('dashboard_name', '')
+        # Same for every row emitted for this report view; resolved once per dashboard and shared
+        dashboard_display_name, dashboard_catalog_path = _dashboard_display_info(dashboard_path)
         page_file = rv.get('page_file', '')
-        worksheet_path = file_path_to_catalog_path(page_file, os.path.join(os.path.dirname(__file__), '..', 'input_xml')) if page_file else ''
+        worksheet_path = file_path_to_catalog_path(page_file, _INPUT_XML_ROOT) if page_file else ''
         
         # Find matching report (case-insensitive)
-        # URL-decode the report path to handle encoded characters like %2e (.)
-        decoded_report_path = unquote(report_path)
-        report_info = reports_map_lower.get(decoded_report_path.lower())
-        if not report_info:
-            base = os.path.basename(decoded_report_path.strip('/')).lower()
-            report_info = reports_by_basename_lower.get(base)
+        report_info = _find_report_info(report_path, reports_map_lower, reports_by_basename_lower)
         
         if report_info:
             report_data = report_info.get('report_data', ())
             if len(report_data) >= 7:
                 view_rows = report_data[3]
                 chart_rows = report_data[6]
+                # view_name -> chart info; the first chart for a view wins, as with a linear scan
+                chart_by_view = {}
+                for c in chart_rows:
+                    chart_by_view.setdefault(c.get('view_name'), c)
                 
-                # Find the compound view and get its current view
+                # Single pass: remember the first compound view and collect the other views in document order
                 compound_view = None
-                # Track the compound's current view name (raw view name)
-                current_view_idx = '0'
+                other_views = []
                 for view in view_rows:
                     if view.get('view_xsi_type') == 'compoundView':
-                        compound_view = view
-                        current_view_idx = view.get('current_view', '0')
-                        break
+                        if compound_view is None:
+                            compound_view = view
+                    else:
+                        other_views.append(view)
                 
                 # If compound view exists, include ALL non-compound views (not just compound members)
+                # and flag the one selected by its current_view index
+                selected_child_name_raw = ''
                 if compound_view:
                     # Resolve selected child RAW name from compound children order using numeric current_view index
-                    selected_child_name_raw = ''
                     try:
                         order_raw = compound_view.get('compound_children_order_raw', []) or []
                         idx_str = compound_view.get('current_view', '0')
@@ -1888,116 +2202,76 @@ def create_charttype_csv_data(agg_dashboard_report_views, reports_map):
                                 selected_child_name_raw = order_raw[idx]
                     except Exception:
                         selected_child_name_raw = ''
-                    # Process all non-compound views in document order
-                    for view in view_rows:
-                        view_type = view.get('view_xsi_type', '')
-                        view_name = view.get('view_name', '')
-                        view_name_raw = view.get('view_name_raw', view_name)
-                        
-                        # Skip the compound view itself
-                        if view_type == 'compoundView':
-                            continue
-                        
-                        # Determine chart type based on view type
-                        if view_type == 'dvtchart':
-                            # Get actual chart type from chart_rows
-                            chart_info = next((c for c in chart_rows if c.get('view_name') == view_name), None)
-                            if chart_info:
-                                display_type = chart_info.get('display_type', 'chart')
-                                display_subtype = chart_info.get('display_subtype', '')
-                                chart_type = f"{display_type}_{display_subtype}" if display_subtype else display_type
-                            else:
-                                chart_type = 'chart'
-                        elif view_type == 'tableView':
-                            chart_type = 'table'
-                        elif view_type == 'pivotTableView':
-                            chart_type = 'pivot'
-                        elif view_type == 'titleView':
-                            chart_type = 'title'
-                        else:
-                            chart_type = view_type
-                        
-                        # Extract title text for titleView
-                        title_text = ''
-                        if view_type == 'titleView':
-                            # Title text would be in the view, but we need to parse the report XML for it
-                            # For now, leave empty - would need additional parsing
-                            title_text = ''
-                        
-                        charttype_rows.append({
-                            'WorksheetName': page_name,
-                            'DashboardName': unquote(dashboard_name.replace('+', ' ').split("/")[-1]),
-                            'ReportName': report_name,
-                            'ReportNameTag': report_view_name,
-                            'ViewId': view_name_raw,
-                            'ViewType': view_type,
-                            'ChartType': chart_type,
-                            'TitleText': title_text,
-                            'IsCurrentView': 'Yes' if view_name_raw == selected_child_name_raw else 'No',
-                            'Reason': '',
-                            'WorksheetPath': worksheet_path,
-                            'DashboardPath': dashboard_name_to_catalog_path(dashboard_path),
-                            'ReportPath': report_path,
-                        })
-                else:
-                    # No compound view, just list all views
-                    for view in view_rows:
-                        view_type = view.get('view_xsi_type', '')
-                        view_name = view.get('view_name', '')
-                        view_name_raw = view.get('view_name_raw', view_name)
-                        
-                        if view_type == 'dvtchart':
-                            chart_info = next((c for c in chart_rows if c.get('view_name') == view_name), None)
-                            if chart_info:
-                                display_type = chart_info.get('display_type', 'chart')
-                                display_subtype = chart_info.get('display_subtype', '')
-                                chart_type = f"{display_type}_{display_subtype}" if display_subtype else display_type
-                            else:
-                                chart_type = 'chart'
-                        elif view_type == 'tableView':
-                            chart_type = 'table'
-                        elif view_type == 'pivotTableView':
-                            chart_type = 'pivot'
-                        elif view_type == 'titleView':
-                            chart_type = 'title'
+                
+                for view in other_views:
+                    view_type = view.get('view_xsi_type', '')
+                    view_name = view.get('view_name', '')
+                    view_name_raw = view.get('view_name_raw', view_name)
+                    
+                    # Determine chart type based on view type
+                    if view_type == 'dvtchart':
+                        # Get actual chart type from chart_rows
+                        chart_info = chart_by_view.get(view_name)
+                        if chart_info:
+                            display_type = chart_info.get('display_type', 'chart')
+                            display_subtype = chart_info.get('display_subtype', '')
+                            chart_type = f"{display_type}_{display_subtype}" if display_subtype else display_type
                         else:
-                            chart_type = view_type
-                        
-                        charttype_rows.append({
-                            'WorksheetName': page_name,
-                            'DashboardName': unquote(dashboard_name.replace('+', ' ').split("/")[-1]),
-                            'ReportName': report_name,
-                            'ReportNameTag': report_view_name,
-                            'ViewId': view_name_raw,
-                            'ViewType': view_type,
-                            'ChartType': chart_type,
-                            'TitleText': '',
-                            'IsCurrentView': 'No',
-                            'Reason': '',
-                            'WorksheetPath': worksheet_path,
-                            'DashboardPath': dashboard_name_to_catalog_path(dashboard_path),
-                            'ReportPath': report_path,
-                        })
+                            chart_type = 'chart'
+                    elif view_type == 'tableView':
+                        chart_type = 'table'
+                    elif view_type == 'pivotTableView':
+                        chart_type = 'pivot'
+                    elif view_type == 'titleView':
+                        chart_type = 'title'
+                    else:
+                        chart_type = view_type
+                    
+                    # Title text would be in the view, but we need to parse the report XML for it
+                    # For now, leave empty - would need additional parsing
+                    title_text = ''
+                    
+                    yield (
+                        page_name,
+                        dashboard_display_name,
+                        report_name,
+                        report_view_name,
+                        view_name_raw,
+                        view_type,
+                        chart_type,
+                        title_text,
+                        'Yes' if compound_view and view_name_raw == selected_child_name_raw else 'No',
+                        '',
+                        worksheet_path,
+                        dashboard_catalog_path,
+                        report_path,
+                    )
         else:
             # Report not found
-            charttype_rows.append({
-                'WorksheetName': page_name,
-                'DashboardName': unquote(dashboard_name.replace('+', ' ').split("/")[-1]),
-                'ReportName': report_name,
-                'ReportNameTag': report_view_name,
-                'ViewName': '',
-                'ViewType': '',
-                'ChartType': 'unknown',
-                'TitleText': '',
-                'IsCurrentView': 'No',
-                'Reason': f'Report not found at path: {report_path}',
-                'WorksheetPath': worksheet_path,
-                'DashboardPath': dashboard_path,
-                'ReportPath': report_path,
-            })
-    
-    return charttype_rows
-
+            yield (
+                page_name,
+                dashboard_display_name,
+                report_name,
+                report_view_name,
+                '',
+                '',
+                'unknown',
+                '',
+                'No',
+                f'Report not found at path: {report_path}',
+                worksheet_path,
+                dashboard_path,
+                report_path,
+            )
+
+def create_charttype_csv_data(agg_dashboard_report_views, reports_map, report_indexes=None):
+    """
+    Create ChartType CSV rows as a list (see iter_charttype_csv_rows).
+    Kept for callers that need the rows materialised; main streams the generator instead.
+    """
+    return list(iter_charttype_csv_rows(agg_dashboard_report_views, reports_map, report_indexes))
+
+@lru_cache(maxsize=None)
 def file_path_to_catalog_path(file_path: str, root_dir: str) -> str:
     """
     Convert a file system path to a catalog path format starting from /shared/.
@@ -2056,23 +2330,103 @@ def dashboard_name_to_catalog_path(dashboard_name: str) -> str:
         path = '/' + path
     return path
 
-def create_filters_csv_data(agg_dashboard_report_views, agg_dashboard_global_filters, reports_map, prompts_map):
+def _parse_report_criteria_filters(file_path: str) -> List[Dict]:
     """
-    Create Filters CSV with detailed column information and prompt details
+    Parse the main criteria filter expression of a report XML file.
+    Returns [] when the file is missing or has no criteria filter.
     """
-    filter_rows = []
+    if not (file_path and os.path.exists(file_path)):
+        return []
+    tree = ET.parse(file_path)
+    root = tree.getroot()
     
-    # Create case-insensitive lookup maps (full path and basename fallbacks)
-    reports_map_lower = {k.lower(): v for k, v in reports_map.items()}
-    reports_by_basename_lower = {}
+    # Find the main filter expression
+    main_filter_expr = find(root, './/saw:criteria/saw:filter/sawx:expr')
+    if main_filter_expr is None:
+        return []
+    # Parse all filter expressions recursively
+    return parse_filter_expression(main_filter_expr)
+
+def _parse_report_criteria_filters_task(file_path: str):
+    """
+    Worker wrapper for _parse_report_criteria_filters.
+    Returns None on failure so the caller retries and logs the error in the main process.
+    """
     try:
-        for k, v in reports_map.items():
-            base = os.path.basename(k.strip('/')).lower()
-            if base and base not in reports_by_basename_lower:
-                reports_by_basename_lower[base] = v
+        return _parse_report_criteria_filters(file_path)
     except Exception:
-        pass
+        return None
+
+def _prompt_lookup_keys(filter_path: str) -> Tuple[str, str]:
+    """
+    Lower-cased prompts_map keys to try for a dashboard filter path: as written, then URL-encoded
+    the way parsed prompt paths are (e.g., "FIN 3.1.3" -> "fin+3%2e1%2e3").
+    """
+    return filter_path.lower(), filter_path.replace('.', '%2e').replace(' ', '+').lower()
+
+def _prefetch_report_criteria_filters(agg_dashboard_report_views, report_indexes, workers: int) -> Dict[str, List[Dict]]:
+    """
+    Parse the criteria filters of every report embedded in the report views, in a process pool when workers > 1.
+    Returns report file path -> parsed filters (files that failed to parse are left out).
+    """
+    reports_map_lower, reports_by_basename_lower = report_indexes
+    file_paths = list(dict.fromkeys(
+        report_info.get('file_path', '')
+        for report_info in (_find_report_info(rv.get('report_path', ''), reports_map_lower, reports_by_basename_lower)
+                            for rv in agg_dashboard_report_views)
+        if report_info and len(report_info.get('report_data', ())) >= 3
+    ))
+    parsed_filters_by_file = {}
+    for file_path, parsed_filters in zip(file_paths, _map_with_workers(_parse_report_criteria_filters_task,
+                                                                        file_paths, workers)):
+        if parsed_filters is not None:
+            parsed_filters_by_file[file_path] = parsed_filters
+    return parsed_filters_by_file
+
+def _referenced_report_indexes(agg_dashboard_report_views, report_indexes):
+    """
+    Narrow _build_report_indexes output to the reports the report views resolve to.
+    Lookups through _find_report_info give the same answers for those views.
+    """
+    reports_map_lower, reports_by_basename_lower = report_indexes
+    used = {id(info) for info in (_find_report_info(rv.get('report_path', ''), reports_map_lower, reports_by_basename_lower)
+                                  for rv in agg_dashboard_report_views) if info}
+    return ({k: v for k, v in reports_map_lower.items() if id(v) in used},
+            {k: v for k, v in reports_by_basename_lower.items() if id(v) in used})
+
+def _referenced_prompts(agg_dashboard_global_filters, prompts_map: Dict[str, Dict]) -> Dict[str, Dict]:
+    """
+    Narrow prompts_map to the prompts the dashboard filters can look up (see _prompt_lookup_keys).
+    """
+    wanted = set()
+    for gf in agg_dashboard_global_filters:
+        wanted.update(_prompt_lookup_keys(gf.get('filter_path', '')))
+    return {k: v for k, v in prompts_map.items() if k.lower() in wanted}
+
+def iter_filters_csv_rows(agg_dashboard_report_views, agg_dashboard_global_filters, reports_map, prompts_map,
+                          report_indexes=None, workers: int = 1, parsed_filters_by_file=None):
+    """
+    Yield Filters CSV rows with detailed column information and prompt details
+    Rows are produced lazily so they can be streamed to the writer.
+    parsed_filters_by_file may carry criteria filters already parsed by _prefetch_report_criteria_filters;
+    otherwise, with workers > 1, they are parsed up front in a process pool.
+    """
+    
+    # Case-insensitive lookup maps (full path and basename fallbacks), shared by the builders when passed in
+    reports_map_lower, reports_by_basename_lower = report_indexes or _build_report_indexes(reports_map)
     prompts_map_lower = {k.lower(): v for k, v in prompts_map.items()}
+    # filter_path -> resolved prompt_info (or None); the same prompt is placed on many pages
+    prompt_info_by_path = {}
+    # Report file path -> parsed criteria filters; a report placed on many pages is parsed once
+    if parsed_filters_by_file is not None:
+        parsed_filters_by_file = dict(parsed_filters_by_file)
+    elif workers > 1:
+        parsed_filters_by_file = _prefetch_report_criteria_filters(
+            agg_dashboard_report_views, (reports_map_lower, reports_by_basename_lower), workers)
+    else:
+        parsed_filters_by_file = {}
+    # Report file path -> column_id lookup for that report
+    col_map_by_report = {}
     
     # Add filters from reports
     for rv in agg_dashboard_report_views:
@@ -2081,16 +2435,12 @@ def create_filters_csv_data(agg_dashboard_report_views, agg_dashboard_global_fil
         report_path = rv.get('report_path', '')
         page_file = rv.get('page_file', '')
         # Convert file path to catalog path
-        worksheet_path = file_path_to_catalog_path(page_file, os.path.join(os.path.dirname(__file__), '..', 'input_xml')) if page_file else ''
-        dashboard_name = rv.get('dashboard_name', '').replace('+', ' ')
+        worksheet_path = file_path_to_catalog_path(page_file, _INPUT_XML_ROOT) if page_file else ''
         dashboard_path = rv.get('dashboard_name', '')
+        # Same for every row emitted for this report view; resolved once per dashboard and shared
+        dashboard_display_name, dashboard_catalog_path = _dashboard_display_info(dashboard_path)
         
-        # URL-decode the report path to handle encoded characters like %2e (.)
-        decoded_report_path = unquote(report_path)
-        report_info = reports_map_lower.get(decoded_report_path.lower())
-        if not report_info:
-            base = os.path.basename(decoded_report_path.strip('/')).lower()
-            report_info = reports_by_basename_lower.get(base)
+        report_info = _find_report_info(report_path, reports_map_lower, reports_by_basename_lower)
         
         if report_info:
             report_data = report_info.get('report_data', ())
@@ -2099,41 +2449,36 @@ def create_filters_csv_data(agg_dashboard_report_views, agg_dashboard_global_fil
                 column_rows = report_data[1]
                 column_order_rows = report_data[2]
                 
-                # Create column lookup
-                col_map = {col.get('column_id', ''): col for col in column_rows}
+                # Create column lookup (once per report)
+                col_map = _report_column_map(report_info, report_path, column_rows, col_map_by_report)
                 
                 # Extract report-level filters from criteria/filter
                 # Parse all filter expressions including complex logical operators
                 try:
                     file_path = report_info.get('file_path', '')
-                    if file_path and os.path.exists(file_path):
-                        tree = ET.parse(file_path)
-                        root = tree.getroot()
-                        
-                        # Find the main filter expression
-                        main_filter_expr = find(root, './/saw:criteria/saw:filter/sawx:expr')
-                        if main_filter_expr is not None:
-                            # Parse all filter expressions recursively
-                            parsed_filters = parse_filter_expression(main_filter_expr)
-                            
-                            for filter_info in parsed_filters:
-                                filter_rows.append({
-                                    'WorksheetName': page_name,
-                                    'DashboardName': unquote(dashboard_name.replace('+', ' ').split("/")[-1]),
-                                    'ReportName': report_name,
-                                    'FilterType': 'ReportFilter',
-                                    'ColumnId': '',
-                                    'ColumnName': filter_info.get('column_name', ''),
-                                    'TableName': filter_info.get('table_name', ''),
-                                    'Direction': '',
-                                    'Expression': filter_info.get('column_expression', ''),
-                                    'Operator': filter_info.get('operator', ''),
-                                    'ParentOperator': filter_info.get('parent_operator', ''),
-                                    'FilterValue': filter_info.get('filter_value', ''),
-                                    'WorksheetPath': worksheet_path,
-                                    'DashboardPath': dashboard_name_to_catalog_path(dashboard_path),
-                                    'ReportPath': report_path,
-                                })
+                    parsed_filters = parsed_filters_by_file.get(file_path)
+                    if parsed_filters is None:
+                        parsed_filters = _parse_report_criteria_filters(file_path)
+                        parsed_filters_by_file[file_path] = parsed_filters
+                    
+                    for filter_info in parsed_filters:
+                        yield {
+                            'WorksheetName': page_name,
+                            'DashboardName': dashboard_display_name,
+                            'ReportName': report_name,
+                            'FilterType': 'ReportFilter',
+                            'ColumnId': '',
+                            'ColumnName': filter_info.get('column_name', ''),
+                            'TableName': filter_info.get('table_name', ''),
+                            'Direction': '',
+                            'Expression': filter_info.get('column_expression', ''),
+                            'Operator': filter_info.get('operator', ''),
+                            'ParentOperator': filter_info.get('parent_operator', ''),
+                            'FilterValue': filter_info.get('filter_value', ''),
+                            'WorksheetPath': worksheet_path,
+                            'DashboardPath': dashboard_catalog_path,
+                            'ReportPath': report_path,
+                        }
                 except Exception as exc:
                     logger.warning(f"Failed to extract report filters from {file_path}: {exc}")
                 
@@ -2153,9 +2498,9 @@ def create_filters_csv_data(agg_dashboard_report_views, agg_dashboard_global_fil
                         if len(parts) >= 4:
                             column_name = parts[3]
                     
-                    filter_rows.append({
+                    yield {
                         'WorksheetName': page_name,
-                        'DashboardName': unquote(dashboard_name.replace('+', ' ').split("/")[-1]),
+                        'DashboardName': dashboard_display_name,
                         'ReportName': report_name,
                         'FilterType': 'Sort',
                         'ColumnId': col_id,
@@ -2164,35 +2509,38 @@ def create_filters_csv_data(agg_dashboard_report_views, agg_dashboard_global_fil
                         'Direction': order.get('direction', ''),
                         'Expression': expression,
                         'WorksheetPath': worksheet_path,
-                        'DashboardPath': dashboard_name_to_catalog_path(dashboard_path),
+                        'DashboardPath': dashboard_catalog_path,
                         'ReportPath': report_path,
-                    })
+                    }
     
     # Add global filters/prompts from dashboard with detailed prompt info
     for gf in agg_dashboard_global_filters:
         filter_path = gf.get('filter_path', '')
         page_name = gf.get('page_name', '')
         page_file = gf.get('page_file', '')
-        worksheet_path = file_path_to_catalog_path(page_file, os.path.join(os.path.dirname(__file__), '..', 'input_xml')) if page_file else ''
-        dashboard_name = gf.get('dashboard_name', '').replace('+', ' ')
+        worksheet_path = file_path_to_catalog_path(page_file, _INPUT_XML_ROOT) if page_file else ''
         dashboard_path = gf.get('dashboard_name', '')
+        # Same for every row emitted for this prompt; resolved once per dashboard and shared
+        dashboard_display_name = _dashboard_display_info(dashboard_path)[0]
         
         # Look up prompt details (try both original and URL-decoded versions)
-        prompt_info = prompts_map_lower.get(filter_path.lower())
-        if not prompt_info:
-            # Try URL-decoding the filter_path (e.g., "FIN 3.1.3" -> "fin 3%2e1%2e3")
-            # We need to URL-encode it to match the parsed paths
-            filter_path_encoded = filter_path.replace('.', '%2e').replace(' ', '+')
-            prompt_info = prompts_map_lower.get(filter_path_encoded.lower())
+        if filter_path in prompt_info_by_path:
+            prompt_info = prompt_info_by_path[filter_path]
+        else:
+            filter_key, filter_key_encoded = _prompt_lookup_keys(filter_path)
+            prompt_info = prompts_map_lower.get(filter_key)
+            if not prompt_info:
+                prompt_info = prompts_map_lower.get(filter_key_encoded)
+            prompt_info_by_path[filter_path] = prompt_info
         
         if prompt_info:
             view_type = prompt_info.get('view_type', '')
             instruction = prompt_info.get('instruction', '')
             prompt_data_list = prompt_info.get('prompt_data', [])
             for prompt_data in prompt_data_list:
-                filter_rows.append({
+                yield {
                     'WorksheetName': page_name,
-                    'DashboardName': unquote(dashboard_name.replace('+', ' ').split("/")[-1]),
+                    'DashboardName': dashboard_display_name,
                     'ReportName': '',  # Empty for global filters as requested
                     'FilterType': view_type if view_type else 'Prompt',  # Use actual view type from XML
                     'PromptType': prompt_data.get('prompt_type', ''),
@@ -2226,12 +2574,12 @@ def create_filters_csv_data(agg_dashboard_report_views, agg_dashboard_global_fil
                     'WorksheetPath': worksheet_path,
                     'DashboardPath': dashboard_path,
                     'ReportPath': filter_path,
-                })
+                }
         else:
             # Fallback if prompt not parsed
-            filter_rows.append({
+            yield {
                 'WorksheetName': page_name,
-                'DashboardName': unquote(dashboard_name.replace('+', ' ').split("/")[-1]),
+                'DashboardName': dashboard_display_name,
                 'ReportName': '',  # Empty for global filters
                 'FilterType': 'Prompt',
                 'ColumnId': '',
@@ -2242,71 +2590,92 @@ def create_filters_csv_data(agg_dashboard_report_views, agg_dashboard_global_fil
                 'WorksheetPath': worksheet_path,
                 'DashboardPath': dashboard_path,
                 'ReportPath': filter_path,
-            })
-    
-    return filter_rows
+            }
 
-def create_windows_csv_data(agg_dashboard_report_views, agg_dashboard_global_filters, agg_dashboard_action_links):
+def create_filters_csv_data(agg_dashboard_report_views, agg_dashboard_global_filters, reports_map, prompts_map,
+                            report_indexes=None, workers: int = 1, parsed_filters_by_file=None):
     """
-    Create Windows CSV with standardized naming and paths
+    Create Filters CSV rows as a list (see iter_filters_csv_rows).
+    Kept for callers that need the rows materialised; main streams the generator instead.
+    """
+    return list(iter_filters_csv_rows(agg_dashboard_report_views, agg_dashboard_global_filters, reports_map,
+                                      prompts_map, report_indexes, workers, parsed_filters_by_file))
+
+# Windows.csv column order; iter_windows_csv_rows emits tuples in this order
+_WINDOWS_HEADER = ('WorksheetName', 'DashboardName', 'WindowName', 'WindowClass',
+                   'SectionName', 'ColumnName', 'Display', 'YPosition',
+                   'WorksheetPath', 'DashboardPath')
+
+def iter_windows_csv_rows(agg_dashboard_report_views, agg_dashboard_global_filters, agg_dashboard_action_links):
+    """
+    Yield Windows CSV rows with standardized naming and paths
+    Rows are tuples in _WINDOWS_HEADER order, produced lazily so they can be streamed to the writer
     """
-    window_rows = []
     
     # Add report views as windows
     for idx, rv in enumerate(agg_dashboard_report_views):
         page_file = rv.get('page_file', '')
-        worksheet_path = file_path_to_catalog_path(page_file, os.path.join(os.path.dirname(__file__), '..', 'input_xml')) if page_file else ''
+        worksheet_path = file_path_to_catalog_path(page_file, _INPUT_XML_ROOT) if page_file else ''
+        dashboard_display_name, dashboard_catalog_path = _dashboard_display_info(rv.get('dashboard_name', ''))
         
-        window_rows.append({
-            'WorksheetName': rv.get('page_name', ''),
-            'DashboardName': unquote(rv.get('dashboard_name', '').replace('+', ' ').split("/")[-1]),
-            'WindowName': rv.get('caption', ''),
-            'WindowClass': 'Reports',
-            'SectionName': rv.get('section_name', ''),
-            'ColumnName': rv.get('column_name', ''),
-            'Display': rv.get('display', ''),
-            'YPosition': idx * 400,
-            'WorksheetPath': worksheet_path,
-            'DashboardPath': dashboard_name_to_catalog_path(rv.get('dashboard_name', '')),
-        })
+        yield (
+            rv.get('page_name', ''),
+            dashboard_display_name,
+            rv.get('caption', ''),
+            'Reports',
+            rv.get('section_name', ''),
+            rv.get('column_name', ''),
+            rv.get('display', ''),
+            idx * 400,
+            worksheet_path,
+            dashboard_catalog_path,
+        )
     
     # Add global filters as windows
     for idx, gf in enumerate(agg_dashboard_global_filters):
         page_file = gf.get('page_file', '')
-        worksheet_path = file_path_to_catalog_path(page_file, os.path.join(os.path.dirname(__file__), '..', 'input_xml')) if page_file else ''
+        worksheet_path = file_path_to_catalog_path(page_file, _INPUT_XML_ROOT) if page_file else ''
+        dashboard_display_name, dashboard_catalog_path = _dashboard_display_info(gf.get('dashboard_name', ''))
         
-        window_rows.append({
-            'WorksheetName': gf.get('page_name', ''),
-            'DashboardName': unquote(gf.get('dashboard_name', '').replace('+', ' ').split("/")[-1]),
-            'WindowName': gf.get('caption', ''),
-            'WindowClass': 'Prompts',
-            'SectionName': gf.get('section_name', ''),
-            'ColumnName': gf.get('column_name', ''),
-            'Display': '',
-            'YPosition': idx * 100,
-            'WorksheetPath': worksheet_path,
-            'DashboardPath': dashboard_name_to_catalog_path(gf.get('dashboard_name', '')),
-        })
+        yield (
+            gf.get('page_name', ''),
+            dashboard_display_name,
+            gf.get('caption', ''),
+            'Prompts',
+            gf.get('section_name', ''),
+            gf.get('column_name', ''),
+            '',
+            idx * 100,
+            worksheet_path,
+            dashboard_catalog_path,
+        )
     
     # Add action links as windows
     for idx, al in enumerate(agg_dashboard_action_links):
         page_file = al.get('page_file', '')
-        worksheet_path = file_path_to_catalog_path(page_file, os.path.join(os.path.dirname(__file__), '..', 'input_xml')) if page_file else ''
+        worksheet_path = file_path_to_catalog_path(page_file, _INPUT_XML_ROOT) if page_file else ''
+        dashboard_display_name, dashboard_catalog_path = _dashboard_display_info(al.get('dashboard_name', ''))
         
-        window_rows.append({
-            'WorksheetName': al.get('page_name', ''),
-            'DashboardName': unquote(al.get('dashboard_name', '').replace('+', ' ').split("/")[-1]),
-            'WindowName': al.get('caption', ''),
-            'WindowClass': 'Links',
-            'SectionName': al.get('section_name', ''),
-            'ColumnName': al.get('column_name', ''),
-            'Display': '',
-            'YPosition': idx * 50,
-            'WorksheetPath': worksheet_path,
-            'DashboardPath': dashboard_name_to_catalog_path(al.get('dashboard_name', '')),
-        })
-    
-    return window_rows
+        yield (
+            al.get('page_name', ''),
+            dashboard_display_name,
+            al.get('caption', ''),
+            'Links',
+            al.get('section_name', ''),
+            al.get('column_name', ''),
+            '',
+            idx * 50,
+            worksheet_path,
+            dashboard_catalog_path,
+        )
+
+def create_windows_csv_data(agg_dashboard_report_views, agg_dashboard_global_filters, agg_dashboard_action_links):
+    """
+    Create Windows CSV rows as a list (see iter_windows_csv_rows).
+    Kept for callers that need the rows materialised; main streams the generator instead.
+    """
+    return list(iter_windows_csv_rows(agg_dashboard_report_views, agg_dashboard_global_filters,
+                                      agg_dashboard_action_links))
 
 def _synthesize_dashboard_report_views_from_reports(reports_map: Dict[str, Dict]) -> List[Dict]:
     """
@@ -2314,8 +2683,6 @@ def _synthesize_dashboard_report_views_from_reports(reports_map: Dict[str, Dict]
     dashboard report views from standalone report XMLs so downstream CSVs are populated.
     """
     synthesized: List[Dict] = []
-    # Root used to compute catalog paths from filesystem
-    input_root = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', 'input_xml'))
     for report_path, info in reports_map.items():
         file_path = info.get('file_path', '')
 
@@ -2325,7 +2692,7 @@ def _synthesize_dashboard_report_views_from_reports(reports_map: Dict[str, Dict]
         page_name = unquote(encoded_base.replace('+', ' ')) if encoded_base else os.path.basename(report_path.strip('/'))
 
         # Compute dashboard path from filesystem directory to avoid splitting on decoded '/'
-        catalog_full = file_path_to_catalog_path(file_path, input_root) if file_path else report_path
+        catalog_full = file_path_to_catalog_path(file_path, _INPUT_XML_ROOT) if file_path else report_path
         # Remove the last segment (the report itself)
         if '/' in catalog_full.strip('/'):
             dashboard_catalog = '/' + '/'.join(catalog_full.strip('/').split('/')[:-1])
@@ -2379,6 +2746,56 @@ def _synthesize_global_filters_from_prompts(prompts_map: Dict[str, Dict]) -> Lis
     logger.info(f"Synthesized {len(synthesized)} global filters from prompts_map")
     return synthesized
 
+# Worksheets.csv and Filters.csv column orders (their builders emit dict rows keyed by these names)
+_WORKSHEETS_HEADER = ('WorksheetName', 'DashboardName', 'ReportName', 'ReportNameTag', 'ViewId',
+                      'DataSourceName', 'TableNames', 'ColumnNames', 'Formula', 'ColumnId', 'ColumnType', 'ExpressionType',
+                      'X', 'Y', 'Encoding', 'MeasureType', 'RiserType', 'Summerized_by', 'IsDerived', 'SourceColumnIds', 'SourceExpressions',
+                      'WorksheetPath', 'DashboardPath', 'ReportPath')
+_FILTERS_HEADER = ('WorksheetName', 'DashboardName', 'ReportName',
+                   'FilterType', 'PromptType', 'PromptName', 'Formula', 'ColumnId', 'ColumnName', 'TableName',
+                   'Direction', 'Expression', 'Operator', 'ParentOperator', 'FilterValue', 'ControlType',
+                   'MaxChoices', 'IncludeAllChoices', 'Required', 'DefaultValues', 'DefaultValuesType',
+                   'UsingCodeValue', 'ConstrainPromptType', 'AutoSelectValue', 'PromptVarLocation',
+                   'PromptVarType', 'PromptVarFormula', 'PromptSourceType', 'PromptChoices', 'SourceFormula',
+                   'Instruction', 'SubjectArea', 'WorksheetPath', 'DashboardPath', 'ReportPath')
+
+def _write_primary_csv(task: Tuple[str, str, tuple]) -> int:
+    """
+    Build one primary CSV from its builder's arguments and stream it to output_dir.
+    Returns the number of rows written.
+    Kept at module level so it can be shipped to worker processes.
+    """
+    csv_name, output_dir, args = task
+    worksheet_counts = {'removed': 0, 'replaced': 0}
+    if csv_name == 'Dashboards.csv':
+        fieldnames, rows = _DASHBOARD_HEADER, iter_dashboard_csv_rows(*args)
+    elif csv_name == 'Worksheets.csv':
+        # Post-processing on the way out: drop rows where TableNames is empty or mistakenly contains
+        # SUM(...)-SUM(...) expression, and normalize ColumnNames OBIEE variable syntax for current month name
+        fieldnames = _WORKSHEETS_HEADER
+        rows = _iter_cleaned_worksheet_rows(iter_worksheets_csv_rows(*args), worksheet_counts)
+    elif csv_name == 'ChartType.csv':
+        fieldnames, rows = _CHARTTYPE_HEADER, iter_charttype_csv_rows(*args)
+    elif csv_name == 'Filters.csv':
+        fieldnames, rows = _FILTERS_HEADER, iter_filters_csv_rows(*args)
+    else:
+        fieldnames, rows = _WINDOWS_HEADER, iter_windows_csv_rows(*args)
+    row_count = write_csv(os.path.join(output_dir, csv_name), list(fieldnames), rows)
+    # Report the worksheet clean-up right after its file is written
+    if worksheet_counts['removed']:
+        logger.info(f"Removed {worksheet_counts['removed']} worksheet rows with invalid TableNames (empty or SUM(...)-SUM(...))")
+    if worksheet_counts['replaced']:
+        logger.info(f"Replaced ColumnNames OBIEE variable syntax with plain name for {worksheet_counts['replaced']} rows (Rvar_Curr_MonthName)")
+    return row_count
+
+def _log_banner(title: str) -> None:
+    """
+    Log a section title framed by '=' rules, one record per line.
+    """
+    logger.info("=" * 80)
+    logger.info(title)
+    logger.info("=" * 80)
+
 def main() -> int:
     """
     Entry point: parse all XML files in input_xml/ and write extracted CSVs.
@@ -2389,15 +2806,17 @@ def main() -> int:
                         help='Input directory to scan (defaults to <repo>/input_xml)')
     parser.add_argument('--output', '-o', dest='output_dir', default=None,
                         help='Output directory for CSVs (defaults to <repo>/data/tmp/output_csv)')
+    parser.add_argument('--workers', '-w', dest='workers', type=int, default=1,
+                        help='Processes used to parse report, prompt and dashboard XMLs (default 1; 0 = one per CPU)')
     args, unknown = parser.parse_known_args()
 
     # root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
     # default_input_dir = os.path.join(root_dir, 'input_xml')
     # # Write to the orderbook-specific output folder by default
     # default_output_dir = os.path.join(root_dir, 'data', 'tmp', 'output_csv_orderbook')
-    root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-    input_xml_dir = os.path.join(root_dir, 'input_xml')
-    output_dir = os.path.join(root_dir, 'data', 'tmp', 'output_csv')
+    root_dir = _REPO_ROOT
+    input_xml_dir = _INPUT_XML_ROOT
+    output_dir = _OUTPUT_CSV_DIR
 
     # logger.info(f"Root: {root_dir}")
     # logger.info(f"Source XML dir: {input_xml_dir}")
@@ -2417,19 +2836,16 @@ def main() -> int:
         return 2
 
     # Step 1: Process all reports recursively
-    logger.info("=" * 80)
-    logger.info("Processing report XMLs recursively")
-    logger.info("=" * 80)
-    reports_map, prompts_map = process_all_reports_recursively(input_xml_dir)
+    _log_banner("Processing report XMLs recursively")
+    workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
+    reports_map, prompts_map = process_all_reports_recursively(input_xml_dir, workers=workers)
     
     # Step 2: Process dashboard XMLs from input_xml directory recursively
-    logger.info("=" * 80)
-    logger.info("Processing dashboard XMLs recursively")
-    logger.info("=" * 80)
+    _log_banner("Processing dashboard XMLs recursively")
     
     agg_dashboards, agg_dashboard_page_refs, agg_dashboard_pages, agg_dashboard_columns, \
     agg_dashboard_sections, agg_dashboard_report_views, agg_dashboard_global_filters, \
-    agg_dashboard_action_links = process_all_dashboards_recursively(input_xml_dir)
+    agg_dashboard_action_links = process_all_dashboards_recursively(input_xml_dir, workers=workers)
     
     logger.info(f"Dashboard processing complete:")
     logger.info(f"  Dashboards: {len(agg_dashboards)}")
@@ -2439,9 +2855,7 @@ def main() -> int:
     logger.info(f"  Action Links: {len(agg_dashboard_action_links)}")
 
     # Step 3: Create integrated CSV data
-    logger.info("=" * 80)
-    logger.info("Creating integrated CSV data")
-    logger.info("=" * 80)
+    _log_banner("Creating integrated CSV data")
     
     # If no dashboard pages were discovered in the input scope, synthesize minimal
     # dashboard-like structures from reports/prompts so CSVs are still populated.
@@ -2454,8 +2868,9 @@ def main() -> int:
         use_gfs = synthesized_gfs
         use_als = []
     else:
-        use_rvs = list(agg_dashboard_report_views)
-        use_gfs = list(agg_dashboard_global_filters)
+        # Extended in place below; the aggregates are not read again after this point
+        use_rvs = agg_dashboard_report_views
+        use_gfs = agg_dashboard_global_filters
         use_als = agg_dashboard_action_links
 
         # Also include standalone reports/prompts not referenced by dashboards so their metadata is captured
@@ -2479,75 +2894,33 @@ def main() -> int:
         except Exception as exc:
             logger.warning(f"Failed to synthesize additional prompts: {exc}")
 
-    # Create Dashboard CSV (replaces DashboardHierarchy)
-    dashboard_rows = create_dashboard_csv_data(use_rvs, use_gfs, use_als)
-    
-    # Create Worksheets CSV with dashboard page + report column details
-    worksheet_rows = create_worksheets_csv_data(use_rvs, reports_map)
-    # Post-process: remove rows where TableNames is empty or mistakenly contains SUM(...)-SUM(...) expression
-    worksheet_rows, removed_tnames = _filter_erroneous_tablenames_rows(worksheet_rows)
-    if removed_tnames:
-        logger.info(f"Removed {removed_tnames} worksheet rows with invalid TableNames (empty or SUM(...)-SUM(...))")
-    # Post-process: normalize ColumnNames OBIEE variable syntax for current month name
-    worksheet_rows, replaced_cols = _normalize_columnnames_biserver_variables(worksheet_rows)
-    if replaced_cols:
-        logger.info(f"Replaced ColumnNames OBIEE variable syntax with plain name for {replaced_cols} rows (Rvar_Curr_MonthName)")
-    
-    # Create ChartType CSV
-    charttype_rows = create_charttype_csv_data(use_rvs, reports_map)
-    
-    # Create Filters CSV
-    filter_rows = create_filters_csv_data(use_rvs, use_gfs, reports_map, prompts_map)
-    
-    # Create Windows CSV
-    window_rows = create_windows_csv_data(use_rvs, use_gfs, use_als)
-    
-    # Write primary CSV files
-    logger.info("=" * 80)
-    logger.info("Writing primary CSV files")
-    logger.info("=" * 80)
-    
-    write_csv(os.path.join(output_dir, 'Dashboards.csv'),
-              ['WorksheetName', 'DashboardName', 'ObjectName', 'ObjectType', 'ObjectPath', 'WorksheetPath', 'DashboardPath'],
-              dashboard_rows)
-    logger.info(f"Dashboards.csv: {len(dashboard_rows)} rows")
-    
-    write_csv(os.path.join(output_dir, 'Worksheets.csv'),
-              ['WorksheetName', 'DashboardName', 'ReportName', 'ReportNameTag', 'ViewId',
-               'DataSourceName', 'TableNames', 'ColumnNames', 'Formula', 'ColumnId', 'ColumnType', 'ExpressionType',
-               'X', 'Y', 'Encoding', 'MeasureType', 'RiserType', 'Summerized_by', 'IsDerived', 'SourceColumnIds', 'SourceExpressions',
-               'WorksheetPath', 'DashboardPath', 'ReportPath'],
-              worksheet_rows)
-    logger.info(f"Worksheets.csv: {len(worksheet_rows)} rows")
-    
-    write_csv(os.path.join(output_dir, 'ChartType.csv'),
-              ['WorksheetName', 'DashboardName', 'ReportName', 'ReportNameTag',
-               'ViewId', 'ViewType', 'ChartType', 'TitleText', 'IsCurrentView', 'Reason',
-               'WorksheetPath', 'DashboardPath', 'ReportPath'],
-              charttype_rows)
-    logger.info(f"ChartType.csv: {len(charttype_rows)} rows")
-    
-    write_csv(os.path.join(output_dir, 'Filters.csv'),
-              ['WorksheetName', 'DashboardName', 'ReportName',
-               'FilterType', 'PromptType', 'PromptName', 'Formula', 'ColumnId', 'ColumnName', 'TableName', 
-               'Direction', 'Expression', 'Operator', 'ParentOperator', 'FilterValue', 'ControlType', 
-               'MaxChoices', 'IncludeAllChoices', 'Required', 'DefaultValues', 'DefaultValuesType', 
-               'UsingCodeValue', 'ConstrainPromptType', 'AutoSelectValue', 'PromptVarLocation', 
-               'PromptVarType', 'PromptVarFormula', 'PromptSourceType', 'PromptChoices', 'SourceFormula', 
-               'Instruction', 'SubjectArea', 'WorksheetPath', 'DashboardPath', 'ReportPath'],
-              filter_rows)
-    logger.info(f"Filters.csv: {len(filter_rows)} rows")
-    
-    write_csv(os.path.join(output_dir, 'Windows.csv'),
-              ['WorksheetName', 'DashboardName', 'WindowName', 'WindowClass',
-               'SectionName', 'ColumnName', 'Display', 'YPosition',
-               'WorksheetPath', 'DashboardPath'],
-              window_rows)
-    logger.info(f"Windows.csv: {len(window_rows)} rows")
-    
-    logger.info("=" * 80)
-    logger.info("All processing complete!")
-    logger.info("=" * 80)
+    # Report lookup maps shared by the worksheet, chart type and filter builders
+    report_indexes = _build_report_indexes(reports_map)
+    
+    # Write primary CSV files; rows are streamed straight from the builders to the files.
+    # The five files are independent, so with workers > 1 each is built and written in its own process.
+    _log_banner("Writing primary CSV files")
+    
+    parsed_filters_by_file = None
+    if workers > 1:
+        # Parse report criteria filters here, in one pool, rather than from inside the Filters task;
+        # the tasks then get only the reports/prompts their rows reference, not the whole maps
+        parsed_filters_by_file = _prefetch_report_criteria_filters(use_rvs, report_indexes, workers)
+        report_indexes = _referenced_report_indexes(use_rvs, report_indexes)
+        prompts_map = _referenced_prompts(use_gfs, prompts_map)
+    
+    csv_tasks = [
+        ('Dashboards.csv', output_dir, (use_rvs, use_gfs, use_als)),
+        ('Worksheets.csv', output_dir, (use_rvs, {}, report_indexes)),
+        ('ChartType.csv', output_dir, (use_rvs, {}, report_indexes)),
+        ('Filters.csv', output_dir, (use_rvs, use_gfs, {}, prompts_map, report_indexes, 1, parsed_filters_by_file)),
+        ('Windows.csv', output_dir, (use_rvs, use_gfs, use_als)),
+    ]
+    csv_results = _map_with_workers(_write_primary_csv, csv_tasks, min(workers, len(csv_tasks)), chunksize=1)
+    for (csv_name, _, _), row_count in zip(csv_tasks, csv_results):
+        logger.info(f"{csv_name}: {row_count} rows")
+    
+    _log_banner("All processing complete!")
 
     return 0
 